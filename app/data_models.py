@@ -13,7 +13,9 @@
 
 import json
 import re
+import numpy as np
 from datetime import datetime
+from operator import attrgetter
 
 class APData:
     """
@@ -56,6 +58,58 @@ class ScanPoint:
         self.timestamp = timestamp
         self.ap_list = ap_list # List of APData objects
 
+    @property
+    def ap_list(self):
+        """List of APData objects detected at this point."""
+        return self._ap_list
+
+    @ap_list.setter
+    def ap_list(self, ap_list):
+        self._ap_list = ap_list
+        # Signal lookups derived from ap_list, rebuilt on first use
+        self._ssid_to_signal = None
+        self._max_signal = None
+        self._sorted_ap_list = None
+
+    def signal_for_ssid(self, ssid):
+        """Returns the signal strength of the first AP with this SSID, or None."""
+        if self._ssid_to_signal is None:
+            self._ssid_to_signal = {}
+            for ap in self._ap_list or []:
+                self._ssid_to_signal.setdefault(ap.ssid, ap.signal_strength)
+        return self._ssid_to_signal.get(ssid)
+
+    @property
+    def max_signal(self):
+        """Strongest signal strength at this point, or None without APs."""
+        if self._max_signal is None and self._ap_list:
+            self._max_signal = max(ap.signal_strength for ap in self._ap_list)
+        return self._max_signal
+
+    @property
+    def network_count(self):
+        """Number of APs detected at this point (0 without an ap_list)."""
+        return len(self._ap_list) if self._ap_list else 0
+
+    @property
+    def sorted_ap_list(self):
+        """APs of ap_list, strongest signal first (shared; do not modify)."""
+        if self._sorted_ap_list is None:
+            self._sorted_ap_list = sorted(self._ap_list or [], key=attrgetter('signal_strength'), reverse=True)
+        return self._sorted_ap_list
+
+    def add_ap(self, ap):
+        """Appends an APData to ap_list, keeping the signal lookups current."""
+        if self._ap_list is None:
+            self._ap_list = []
+        self._ap_list.append(ap)
+        # Update lookups that were already built instead of rebuilding them
+        if self._ssid_to_signal is not None:
+            self._ssid_to_signal.setdefault(ap.ssid, ap.signal_strength)
+        if self._max_signal is not None and ap.signal_strength > self._max_signal:
+            self._max_signal = ap.signal_strength
+        self._sorted_ap_list = None
+
     def to_dict(self):
         return {
             'map_x': self.map_x,
@@ -232,9 +286,52 @@ class ScaleLine:
         return value_in_feet * 0.3048
 
 
+class _PositionBuffer:
+    """
+    Map positions of a list of placed objects (anything with map_x/map_y),
+    stored in list order in one preallocated (capacity, 2) NumPy array so
+    distance queries run over contiguous memory. Grows by doubling.
+    """
+    def __init__(self, items=()):
+        self._xy = np.empty((max(16, len(items)), 2), dtype=np.float64)
+        self.count = 0
+        self.reset(items)
+
+    def reset(self, items):
+        """Rebuild the positions from a list of objects."""
+        if len(items) > len(self._xy):
+            self._xy = np.empty((2 * len(items), 2), dtype=np.float64)
+        for i, item in enumerate(items):
+            self._xy[i] = item.map_x, item.map_y
+        self.count = len(items)
+
+    def append(self, x, y):
+        if self.count == len(self._xy):
+            grown = np.empty((2 * len(self._xy), 2), dtype=np.float64)
+            grown[:self.count] = self._xy[:self.count]
+            self._xy = grown
+        self._xy[self.count] = x, y
+        self.count += 1
+
+    def move(self, index, x, y):
+        self._xy[index] = x, y
+
+    def remove(self, index):
+        self._xy[index:self.count - 1] = self._xy[index + 1:self.count]
+        self.count -= 1
+
+    def positions(self):
+        """(count, 2) view of the stored positions."""
+        return self._xy[:self.count]
+
 class Floor:
     """
     Encapsulates data for a single floor plan.
+
+    The positions of the placed APs and scan points are also kept as NumPy
+    arrays aligned with the lists. Add, move and remove them through the
+    helper methods to keep the arrays in step; direct list changes are picked
+    up by a rebuild when the lengths no longer match.
     """
     def __init__(self, floor_number, original_image_path, cropped_image_path, scaled_image_path,
                  scale_line_horizontal=None, scale_line_vertical=None, placed_aps=None, scan_points=None):
@@ -246,6 +343,70 @@ class Floor:
         self.scale_line_vertical = scale_line_vertical   # ScaleLine object
         self.placed_aps = placed_aps if placed_aps is not None else [] # List of PlacedAP objects
         self.scan_points = scan_points if scan_points is not None else [] # List of ScanPoint objects
+        self._ap_positions = _PositionBuffer(self.placed_aps)
+        self._scan_point_positions = _PositionBuffer(self.scan_points)
+
+    def placed_ap_positions(self):
+        """
+        Returns:
+            (N, 2) float array of the placed APs' map positions, in list order
+        """
+        if self._ap_positions.count != len(self.placed_aps):
+            self._ap_positions.reset(self.placed_aps)
+        return self._ap_positions.positions()
+
+    def scan_point_positions(self):
+        """
+        Returns:
+            (N, 2) float array of the scan points' map positions, in list order
+        """
+        if self._scan_point_positions.count != len(self.scan_points):
+            self._scan_point_positions.reset(self.scan_points)
+        return self._scan_point_positions.positions()
+
+    def add_placed_ap(self, ap):
+        in_step = self._ap_positions.count == len(self.placed_aps)
+        self.placed_aps.append(ap)
+        if in_step:
+            self._ap_positions.append(ap.map_x, ap.map_y)
+
+    def move_placed_ap(self, ap, map_x, map_y):
+        ap.map_x = map_x
+        ap.map_y = map_y
+        if self._ap_positions.count == len(self.placed_aps):
+            self._ap_positions.move(self.placed_aps.index(ap), map_x, map_y)
+
+    def remove_placed_ap(self, ap):
+        """Removes ap and returns its former index; ValueError if it is not placed."""
+        index = self.placed_aps.index(ap)
+        in_step = self._ap_positions.count == len(self.placed_aps)
+        del self.placed_aps[index]
+        if in_step:
+            self._ap_positions.remove(index)
+        return index
+
+    def clear_placed_aps(self):
+        self.placed_aps.clear()
+        self._ap_positions.reset(self.placed_aps)
+
+    def add_scan_point(self, scan_point):
+        in_step = self._scan_point_positions.count == len(self.scan_points)
+        self.scan_points.append(scan_point)
+        if in_step:
+            self._scan_point_positions.append(scan_point.map_x, scan_point.map_y)
+
+    def remove_scan_point(self, scan_point):
+        """Removes scan_point and returns its former index; ValueError if it is not on this floor."""
+        index = self.scan_points.index(scan_point)
+        in_step = self._scan_point_positions.count == len(self.scan_points)
+        del self.scan_points[index]
+        if in_step:
+            self._scan_point_positions.remove(index)
+        return index
+
+    def clear_scan_points(self):
+        self.scan_points.clear()
+        self._scan_point_positions.reset(self.scan_points)
 
     def to_dict(self):
         return {
@@ -11,16 +11,113 @@
 # Creates visual overlays showing WiFi coverage based on scan point data.
 # -----------------------------------------------------------------------------
 
+import math
 import numpy as np
-import time
-from PyQt5.QtGui import QColor, QPixmap, QPainter, QBrush
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from PyQt5.QtGui import QColor, QPixmap, QPainter, QBrush, QImage
 from PyQt5.QtCore import Qt
-from typing import List, Tuple, Optional, Dict
-from scipy.interpolate import griddata
-from scipy.ndimage import gaussian_filter
+from typing import List, Tuple, Optional
 
 from .data_models import ScanPoint, APData, Floor
 
+# numexpr is optional: it evaluates the per-pixel interference kernels in
+# cache-sized, multithreaded chunks. Fall back to plain NumPy without it.
+try:
+    import numexpr as ne
+    ne.set_num_threads(os.cpu_count() or 1)
+except ImportError:
+    ne = None
+
+# numba is optional: it compiles the signal grid kernels to parallel
+# machine code. Fall back to NumPy / plain Python without it.
+try:
+    from numba import njit, prange, get_num_threads
+    # Start the parallel runtime on the importing (GUI) thread; when it is first
+    # started from a Qt worker thread the process hangs on exit
+    get_num_threads()
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _compute_signal_grid(ap_x, ap_y, max_signal, path_loss, max_radius_sq, width, grid_resolution,
+                             col_start, col_stop, row_start, row_stop):
+        """
+        Compute the strongest signal at every grid cell center in a block of cells.
+
+        Args:
+            ap_x, ap_y: AP pixel coordinates (float32)
+            max_signal: Strongest measured signal per AP (dBm)
+            path_loss: Path loss per foot per AP
+            max_radius_sq: Squared pixel radius of each AP's -95 dBm reach
+            width: Heatmap width in pixels
+            grid_resolution: Pixels per grid cell
+            col_start, col_stop: Range of grid columns to compute
+            row_start, row_stop: Range of grid rows to compute
+
+        Returns:
+            float32 2D array of signal strengths (dBm)
+        """
+        feet_per_pixel = np.float32(164.0 / width)
+        half_cell = grid_resolution // 2
+        signal_grid = np.empty((row_stop - row_start, col_stop - col_start), dtype=np.float32)
+
+        for row in prange(row_stop - row_start):
+            y = np.float32((row_start + row) * grid_resolution + half_cell)
+            for col in range(col_stop - col_start):
+                x = np.float32((col_start + col) * grid_resolution + half_cell)
+                strongest = np.float32(-999.0)
+                for i in range(ap_x.shape[0]):
+                    dx = x - ap_x[i]
+                    dy = y - ap_y[i]
+                    d2 = dx * dx + dy * dy
+                    # Out of reach: skip the sqrt, the cell is below the cutoff
+                    if d2 >= max_radius_sq[i]:
+                        continue
+                    signal = max_signal[i] - np.sqrt(d2) * feet_per_pixel * path_loss[i]
+                    if signal > strongest:
+                        strongest = signal
+                signal_grid[row, col] = strongest
+
+        return signal_grid
+else:
+    _compute_signal_grid = None
+
+
+@dataclass
+class APLocations:
+    """
+    Estimated AP source locations stored as parallel arrays (one entry per AP).
+
+    Indexing with an integer returns the legacy per-AP dict.
+    """
+    xs: np.ndarray
+    ys: np.ndarray
+    max_signals: np.ndarray
+    path_loss: np.ndarray
+    bssids: list
+    ssids: list
+    channels: list
+    bands: list
+
+    def __len__(self):
+        return len(self.bssids)
+
+    def __getitem__(self, index):
+        return {
+            'bssid': self.bssids[index],
+            'x': float(self.xs[index]),
+            'y': float(self.ys[index]),
+            'max_signal': float(self.max_signals[index]),
+            'ssid': self.ssids[index],
+            'channel': self.channels[index],
+            'band': self.bands[index],
+            'path_loss_per_foot': float(self.path_loss[index]),
+            'placed_ap': None
+        }
+
 
 class HeatmapGenerator:
     """
@@ -43,6 +140,9 @@ class HeatmapGenerator:
         (-90, -120, QColor(0, 0, 255, 180))      # Blue - Very Poor
     ]
 
+    # Number of concentric rings used to model each interference source
+    INTERFERENCE_RINGS = 8
+
     def __init__(self, width: int = 1920, height: int = 1080):
         """
         Initialize the heatmap generator.
@@ -53,8 +153,49 @@ class HeatmapGenerator:
         """
         self.width = width
         self.height = height
-        self.grid_resolution = 15  # Moderate resolution for realistic appearance
-        self.gaussian_sigma = 1.5  # Light smoothing to preserve signal variations
+        self._edge_angle_idx = 0  # Golden-angle counter for single-measurement sources
+
+        # Render interference heatmaps into a NumPy pixel buffer instead of
+        # issuing QPainter ellipse calls per ring (QPainter path kept as fallback)
+        self.use_numpy_interference_renderer = True
+        self._interference_lut = self._build_interference_lut()
+
+        # Scan points flattened to parallel arrays, reused while the points are unchanged
+        self._soa_cache = None
+
+        # Signal heatmap RGBA buffer, reused across regenerations of the
+        # same size as ((width, height), array)
+        self._buf_cache = None
+
+        # Signal gradient colors, one RGBA entry per dBm from -15 to -95
+        self._color_lut = self._build_color_lut()
+
+        # SIGNAL_RANGES unpacked into parallel arrays for vectorized lookups:
+        # strongest and weakest dBm of each band, and its color
+        self._range_min = np.array([strongest for strongest, _, _ in self.SIGNAL_RANGES], dtype=np.float32)
+        self._range_max = np.array([weakest for _, weakest, _ in self.SIGNAL_RANGES], dtype=np.float32)
+        self._range_colors = [color for _, _, color in self.SIGNAL_RANGES]
+
+        # Lower edge of each band but the last, ascending for searchsorted
+        # (-90, -75, -60, -45)
+        self._bin_edges = self._range_max[-2::-1].copy()
+
+        # Same colors as packed ARGB32 values (QColor.rgba), plus a transparent
+        # entry for no data; every vectorized palette gather indexes this
+        self._range_palette = np.array([color.rgba() for color in self._range_colors] + [0],
+                                       dtype=np.uint32)
+
+    @property
+    def width(self) -> int:
+        """Heatmap width in pixels; the floor plan width spans 164 feet."""
+        return self._width
+
+    @width.setter
+    def width(self, value: int):
+        self._width = value
+        # Unit conversions used by every path loss calculation
+        self._pixels_per_foot = value / 164.0
+        self._feet_per_pixel = 164.0 / value
 
     def generate_heatmap(self, scan_points: List[ScanPoint],
                         target_network: Optional[str] = None,
@@ -63,6 +204,9 @@ class HeatmapGenerator:
         """
         Generate a signal strength heatmap from scan point data.
 
+        The map view renders through generate_heatmap_update in a worker
+        thread instead, which re-renders only the changed region.
+
         Args:
             scan_points: List of scan points containing AP data
             target_network: Specific network SSID to focus on (if None, uses strongest signal)
@@ -77,182 +221,153 @@ class HeatmapGenerator:
         # Use direct signal-based rendering instead of grid interpolation
         return self._create_signal_based_heatmap(scan_points, target_network, floor, status_callback)
 
-    def _extract_signal_data(self, scan_points: List[ScanPoint],
-                           target_network: Optional[str]) -> List[Tuple[float, float, float]]:
+    def generate_heatmap_update(self, scan_points: List[ScanPoint],
+                                target_network: Optional[str] = None,
+                                floor: Optional[Floor] = None,
+                                previous: Optional['APLocations'] = None,
+                                status_callback=None):
         """
-        Extract (x, y, signal_strength) tuples from scan points.
-
-        Args:
-            scan_points: List of scan points
-            target_network: Target network SSID, or None for strongest signal
-
-        Returns:
-            List of (x, y, signal_strength) tuples
-        """
-        signal_data = []
-
-        for scan_point in scan_points:
-            if not scan_point.ap_list:
-                continue
-
-            # Find the signal strength for this point
-            signal_strength = None
+        Render only the part of the heatmap that changed since it was rendered
+        for the AP estimates in previous. This creates no QPixmap (QPixmap is
+        GUI-thread only), so it can run in a worker thread.
 
-            if target_network:
-                # Look for specific network
-                for ap in scan_point.ap_list:
-                    if ap.ssid == target_network:
-                        signal_strength = ap.signal_strength
-                        break
-            else:
-                # Use strongest signal at this point
-                signal_strength = max(ap.signal_strength for ap in scan_point.ap_list)
-
-            if signal_strength is not None:
-                signal_data.append((
-                    float(scan_point.map_x),
-                    float(scan_point.map_y),
-                    float(signal_strength)
-                ))
-
-        return signal_data
-
-    def _interpolate_signals(self, signal_data: List[Tuple[float, float, float]]) -> np.ndarray:
-        """
-        Create interpolated signal strength grid using scipy.
+        Every AP is drawn as a disc of its -95 dBm reach around its estimated
+        location, so a scan point change only affects the discs of the APs
+        whose estimate it moved; everything outside them is left as it is.
 
         Args:
-            signal_data: List of (x, y, signal_strength) tuples
+            scan_points: List of scan points containing AP data
+            target_network: Specific network SSID to focus on (if None, uses strongest signal)
+            floor: Floor object for coordinate scaling (optional)
+            previous: APLocations the existing heatmap was rendered from, as
+                returned by an earlier call; None renders the whole heatmap
+            status_callback: Called with (percent, target_network) as rendering progresses
 
         Returns:
-            2D numpy array with interpolated signal values
+            Tuple (image, rect, ap_locations): image is a QImage owning its
+            pixel data to draw at rect, an (x, y, width, height) tuple in
+            heatmap pixels, replacing what is there. image is None when
+            nothing changed, or - with previous None - when there is nothing
+            to draw. ap_locations is to be passed as previous next time.
         """
-        # Handle insufficient points for interpolation
-        if len(signal_data) < 3:
-            return self._create_simple_heatmap(signal_data)
-
-        # Separate coordinates and values
-        points = np.array([(x, y) for x, y, _ in signal_data])
-        values = np.array([signal for _, _, signal in signal_data])
+        ap_locations = self._identify_ap_locations(scan_points or [], target_network, floor)
+        grid_resolution = 4  # pixels per grid cell, as in _build_heatmap_image
+        grid_width = self.width // grid_resolution
+        grid_height = self.height // grid_resolution
 
-        # Create interpolation grid
-        grid_x = np.linspace(0, self.width, self.width // self.grid_resolution)
-        grid_y = np.linspace(0, self.height, self.height // self.grid_resolution)
-        grid_X, grid_Y = np.meshgrid(grid_x, grid_y)
+        if previous is None:
+            if not ap_locations:
+                return None, None, ap_locations
+            cells = (0, 0, grid_width, grid_height)
+        else:
+            cells = self._changed_cells(previous, ap_locations, grid_resolution, grid_width, grid_height)
+            if cells is None:
+                return None, None, ap_locations
 
-        # Interpolate using radial basis function
-        try:
-            grid_values = griddata(points, values, (grid_X, grid_Y),
-                                 method='cubic', fill_value=np.nan)
+        if status_callback:
+            status_callback(10, target_network)
 
-            # Apply gaussian smoothing
-            grid_values = gaussian_filter(grid_values, sigma=self.gaussian_sigma)
+        col_start, row_start, col_stop, row_stop = cells
+        width = (col_stop - col_start) * grid_resolution
+        height = (row_stop - row_start) * grid_resolution
+        buf = np.empty((height, width, 4), dtype=np.uint8)
+        self._render_heatmap_cells(ap_locations, cells, grid_resolution, buf)
 
-        except Exception:
-            try:
-                # Fallback to linear interpolation if cubic fails
-                grid_values = griddata(points, values, (grid_X, grid_Y),
-                                     method='linear', fill_value=np.nan)
-            except Exception:
-                # Last resort: use simple nearest neighbor
-                grid_values = griddata(points, values, (grid_X, grid_Y),
-                                     method='nearest', fill_value=np.nan)
+        # Copy so the image owns its pixels once buf goes away
+        image = QImage(buf.data, width, height, width * 4, QImage.Format_RGBA8888).copy()
+        rect = (col_start * grid_resolution, row_start * grid_resolution, width, height)
 
-        return grid_values
+        if status_callback:
+            status_callback(100, target_network)
+        return image, rect, ap_locations
 
-    def _create_simple_heatmap(self, signal_data: List[Tuple[float, float, float]]) -> np.ndarray:
+    def _changed_cells(self, previous, current, grid_resolution, grid_width, grid_height):
         """
-        Create a simple heatmap for cases with too few points for interpolation.
+        Grid cells whose strongest signal may differ between two sets of AP estimates.
 
         Args:
-            signal_data: List of (x, y, signal_strength) tuples
+            previous, current: APLocations before and after the change
+            grid_resolution: Pixels per grid cell
+            grid_width, grid_height: Grid size in cells
 
         Returns:
-            2D numpy array with signal values at specific points
+            (col_start, row_start, col_stop, row_stop) bounding all reach discs
+            of added, removed and changed APs, or None when no AP changed
         """
-        # Create grid dimensions
-        grid_width = self.width // self.grid_resolution
-        grid_height = self.height // self.grid_resolution
-
-        # Initialize with NaN
-        grid_values = np.full((grid_height, grid_width), np.nan)
-
-        # Place signal values at approximate grid positions
-        for x, y, signal in signal_data:
-            # Convert to grid coordinates
-            grid_x = min(int(x * grid_width / self.width), grid_width - 1)
-            grid_y = min(int(y * grid_height / self.height), grid_height - 1)
-
-            # Set value and nearby cells to create a small coverage area
-            for dy in range(-2, 3):
-                for dx in range(-2, 3):
-                    gx, gy = grid_x + dx, grid_y + dy
-                    if 0 <= gx < grid_width and 0 <= gy < grid_height:
-                        # Distance-based falloff
-                        distance = np.sqrt(dx*dx + dy*dy)
-                        if distance <= 2:
-                            falloff = max(0, 1 - distance/3)
-                            current_val = grid_values[gy, gx]
-                            new_val = signal * falloff
-
-                            # Use strongest signal if multiple overlap
-                            if np.isnan(current_val) or new_val > current_val:
-                                grid_values[gy, gx] = new_val
+        def params(ap_locations):
+            radius, _ = self._coverage_radii(ap_locations)
+            return {bssid: (ap_locations.xs[i], ap_locations.ys[i], ap_locations.max_signals[i],
+                            ap_locations.path_loss[i], radius[i])
+                    for i, bssid in enumerate(ap_locations.bssids)}
+
+        before, after = params(previous), params(current)
+        discs = [p for bssid, p in before.items() if after.get(bssid) != p]
+        discs += [p for bssid, p in after.items() if before.get(bssid) != p]
+        discs = [p for p in discs if p[4] > 0]
+        if not discs:
+            return None
 
-        return grid_values
+        # Cells whose center lies within a disc's bounding box
+        x0 = min(x - r for x, _, _, _, r in discs)
+        x1 = max(x + r for x, _, _, _, r in discs)
+        y0 = min(y - r for _, y, _, _, r in discs)
+        y1 = max(y + r for _, y, _, _, r in discs)
+        col_start = max(0, int(x0 // grid_resolution))
+        col_stop = min(grid_width, int(x1 // grid_resolution) + 1)
+        row_start = max(0, int(y0 // grid_resolution))
+        row_stop = min(grid_height, int(y1 // grid_resolution) + 1)
+        if col_start >= col_stop or row_start >= row_stop:
+            return None
+        return col_start, row_start, col_stop, row_stop
 
-    def _array_to_pixmap(self, heatmap_array: np.ndarray) -> QPixmap:
+    def _scan_points_to_soa(self, scan_points: List[ScanPoint]):
         """
-        Convert numpy array to QPixmap with circular signal patterns.
+        Flatten scan points into parallel arrays with one row per AP measurement.
+
+        The result is cached until the points, their positions or AP lists
+        change. The list itself may be a new one each call (e.g. a snapshot).
 
         Args:
-            heatmap_array: 2D array of signal strength values
+            scan_points: List of scan points
 
         Returns:
-            QPixmap with colored heatmap overlay
+            Tuple of arrays (point_idx, ssids, bssids, signals, xs, ys, aps)
         """
-        pixmap = QPixmap(self.width, self.height)
-        pixmap.fill(Qt.transparent)
-
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-
-        # Get array dimensions
-        rows, cols = heatmap_array.shape
-        cell_width = self.width / cols
-        cell_height = self.height / rows
-
-        # Calculate cell radius for circular coverage
-        cell_radius = max(cell_width, cell_height) * 0.8
-
-        # Draw heatmap cells as circles (realistic RF propagation)
-        for i in range(rows):
-            for j in range(cols):
-                signal_strength = heatmap_array[i, j]
-
-                # Skip NaN values (no data)
-                if np.isnan(signal_strength):
-                    continue
-
-                # Get color for this signal strength
-                color = self._signal_to_color(signal_strength)
-
-                # Calculate center position
-                center_x = j * cell_width + cell_width / 2
-                center_y = i * cell_height + cell_height / 2
-
-                # Draw filled circle
-                painter.setBrush(QBrush(color))
-                painter.setPen(Qt.NoPen)
-                painter.drawEllipse(
-                    int(center_x - cell_radius),
-                    int(center_y - cell_radius),
-                    int(cell_radius * 2),
-                    int(cell_radius * 2)
-                )
-
-        painter.end()
-        return pixmap
+        # Snapshot of each point, its position and AP list, so edits to any invalidate the cache
+        snapshot = [(scan_point, scan_point.ap_list, len(scan_point.ap_list or []),
+                     scan_point.map_x, scan_point.map_y)
+                    for scan_point in scan_points]
+        cached = self._soa_cache
+        if (cached is not None and len(cached[0]) == len(snapshot)
+                and all(a[0] is b[0] and a[1] is b[1] and a[2:] == b[2:]
+                        for a, b in zip(cached[0], snapshot))):
+            return cached[1]
+
+        point_idx, ssids, bssids, signals, xs, ys, aps = [], [], [], [], [], [], []
+        for index, scan_point in enumerate(scan_points):
+            for ap in scan_point.ap_list or []:
+                point_idx.append(index)
+                # Hidden networks may report None; keep the object arrays all-str
+                # so np.unique can sort them
+                ssids.append(ap.ssid or "")
+                bssids.append(ap.bssid or "")
+                signals.append(ap.signal_strength)
+                xs.append(scan_point.map_x)
+                ys.append(scan_point.map_y)
+                aps.append(ap)
+
+        soa = (
+            np.array(point_idx, dtype=np.intp),
+            np.array(ssids, dtype=object),
+            np.array(bssids, dtype=object),
+            np.array(signals, dtype=np.float32),
+            np.array(xs, dtype=np.float32),
+            np.array(ys, dtype=np.float32),
+            aps
+        )
+
+        self._soa_cache = (snapshot, soa)
+        return soa
 
     def _create_signal_based_heatmap(self, scan_points: List[ScanPoint],
                                    target_network: Optional[str] = None,
@@ -281,17 +396,17 @@ class HeatmapGenerator:
         pixmap = QPixmap(self.width, self.height)
         pixmap.fill(Qt.transparent)
 
-        # Create signal strength grid to determine strongest signal at each point
+        # Render the strongest signal at each point
         if status_callback:
             status_callback(10, target_network)
 
-        signal_grid = self._create_signal_strength_grid(ap_locations, target_network, status_callback)
+        heatmap_image = self._build_heatmap_image(ap_locations, target_network, status_callback)
 
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing, True)
 
-        # Draw the signal strength grid as colored pixels
-        self._draw_signal_grid(painter, signal_grid)
+        # Draw the strongest-signal grid as colored pixels in a single blit
+        painter.drawImage(0, 0, heatmap_image)
 
         if status_callback:
             status_callback(100, target_network)
@@ -309,266 +424,230 @@ class HeatmapGenerator:
             floor: Floor object (used for boundary info, optional)
 
         Returns:
-            List of estimated AP location data with coordinates and signal info
+            APLocations with the estimated coordinates and signal info per AP
         """
-        ap_locations = []
-
-        if not scan_points:
-            return ap_locations
+        xs, ys, max_signals = [], [], []
+        bssids, ssids, channels, bands = [], [], [], []
 
-        # Collect all networks matching the target
-        network_measurements = {}  # bssid -> list of (x, y, signal_strength)
-
-        for scan_point in scan_points:
-            if not scan_point.ap_list:
-                continue
+        point_idx, point_ssids, point_bssids, signals, point_xs, point_ys, aps = \
+            self._scan_points_to_soa(scan_points or [])
 
-            for ap in scan_point.ap_list:
-                # Filter by target network if specified
-                if target_network and ap.ssid != target_network:
-                    continue
-
-                bssid = ap.bssid
-                if bssid not in network_measurements:
-                    network_measurements[bssid] = []
+        # Collect all measurements matching the target
+        if target_network:
+            rows = np.flatnonzero(point_ssids == target_network)
+        else:
+            rows = np.arange(len(point_bssids))
 
-                network_measurements[bssid].append({
-                    'x': scan_point.map_x,
-                    'y': scan_point.map_y,
-                    'signal': ap.signal_strength,
-                    'ap_data': ap
-                })
+        # Group the measurements by BSSID, in order of first appearance
+        _, first, inverse, counts = np.unique(point_bssids[rows], return_index=True,
+                                              return_inverse=True, return_counts=True)
+        grouped_rows = rows[np.argsort(inverse, kind='stable')]
+        group_starts = np.cumsum(counts) - counts
 
         # For each unique BSSID, estimate the source location
-        for bssid, measurements in network_measurements.items():
-            if len(measurements) < 2:  # Need at least 2 measurements for estimation
+        for group in np.argsort(first):
+            if counts[group] < 2:  # Need at least 2 measurements for estimation
                 continue
 
-            estimated_location = self._estimate_ap_source_location(measurements)
+            group_rows = grouped_rows[group_starts[group]:group_starts[group] + counts[group]]
+            estimated_location = self._estimate_ap_source_location(
+                point_xs[group_rows], point_ys[group_rows], signals[group_rows],
+                [aps[row] for row in group_rows])
             if estimated_location:
-                ap_locations.append(estimated_location)
-
-        return ap_locations
-
-    def _estimate_ap_source_location(self, measurements):
+                xs.append(estimated_location['x'])
+                ys.append(estimated_location['y'])
+                max_signals.append(estimated_location['max_signal'])
+                bssids.append(estimated_location['bssid'])
+                ssids.append(estimated_location['ssid'])
+                channels.append(estimated_location['channel'])
+                bands.append(estimated_location['band'])
+
+        # Convert to parallel arrays once; single precision is plenty for
+        # ~1 dB signal values and halves the memory traffic of the grid
+        return APLocations(
+            xs=np.array(xs, dtype=np.float32),
+            ys=np.array(ys, dtype=np.float32),
+            max_signals=np.array(max_signals, dtype=np.float32),
+            path_loss=np.array([0.5 if band == '2.4 GHz' else 0.6 for band in bands], dtype=np.float32),
+            bssids=bssids,
+            ssids=ssids,
+            channels=channels,
+            bands=bands
+        )
+
+    def _estimate_ap_source_location(self, xs, ys, signals, aps):
         """
         Estimate AP source location from signal strength measurements.
 
         Args:
-            measurements: List of {'x': x, 'y': y, 'signal': signal, 'ap_data': ap_data}
+            xs, ys: Measurement coordinates
+            signals: Measured signal strengths (dBm)
+            aps: APData for each measurement
 
         Returns:
             Dict with estimated AP location and signal info
         """
-        if not measurements:
+        if not len(signals):
             return None
 
         # Find the measurement with strongest signal (closest to source)
-        strongest_measurement = max(measurements, key=lambda m: m['signal'])
-
-        # Use weighted average based on signal strength for more accuracy
-        total_weight = 0
-        weighted_x = 0
-        weighted_y = 0
-
-        for measurement in measurements:
-            # Convert dBm to linear scale for weighting (higher signal = more weight)
-            # Use exponential weighting: stronger signals get much more influence
-            signal_linear = pow(10, measurement['signal'] / 10)
-            weight = signal_linear
+        ap_data = aps[int(np.argmax(signals))]
+        strongest_signal = ap_data.signal_strength
 
-            weighted_x += measurement['x'] * weight
-            weighted_y += measurement['y'] * weight
-            total_weight += weight
-
-        if total_weight == 0:
+        # Use weighted average based on signal strength for more accuracy:
+        # convert dBm to linear scale so stronger signals get much more influence
+        weights = np.exp(signals * (np.log(10) / 10.0))
+        if weights.sum() == 0:
             return None
 
-        estimated_x = weighted_x / total_weight
-        estimated_y = weighted_y / total_weight
+        estimated_x = np.average(xs, weights=weights)
+        estimated_y = np.average(ys, weights=weights)
 
         return {
-            'bssid': strongest_measurement['ap_data'].bssid,
+            'bssid': ap_data.bssid,
             'x': estimated_x,  # Estimated AP source location
             'y': estimated_y,
-            'max_signal': strongest_measurement['signal'],
-            'ssid': strongest_measurement['ap_data'].ssid,
-            'channel': strongest_measurement['ap_data'].channel,
-            'band': getattr(strongest_measurement['ap_data'], 'band', '2.4 GHz'),
+            'max_signal': strongest_signal,
+            'ssid': ap_data.ssid,
+            'channel': ap_data.channel,
+            'band': getattr(ap_data, 'band', '2.4 GHz'),
             'placed_ap': None  # This is an estimated location, not a placed AP
         }
 
-    def _create_signal_strength_grid(self, ap_locations, target_network=None, progress_callback=None):
+    def _compute_signal_rows(self, ap_locations, row_start, row_stop, grid_resolution,
+                             col_start=0, col_stop=None):
         """
-        Create a grid where each cell contains the strongest signal at that location.
+        Compute the strongest signal for a band of grid rows.
 
         Args:
-            ap_locations: List of AP location data
+            ap_locations: APLocations with per-AP parallel arrays
+            row_start, row_stop: Range of grid rows to compute
+            grid_resolution: Pixels per grid cell
+            col_start, col_stop: Range of grid columns to compute (default: all)
 
         Returns:
-            2D numpy array with signal strength values (strongest signal wins)
+            2D numpy array of signal strengths; cells out of every AP's reach
+            are at or below -95 dBm
         """
-        # Use a reasonable grid resolution for smooth gradients
-        grid_resolution = 4  # pixels per grid cell
-        grid_width = self.width // grid_resolution
-        grid_height = self.height // grid_resolution
+        if col_stop is None:
+            col_stop = self.width // grid_resolution
+
+        # Per-AP parameters as parallel arrays
+        ap_x = ap_locations.xs
+        ap_y = ap_locations.ys
+        max_signal = ap_locations.max_signals
+        path_loss = ap_locations.path_loss
+
+        if _compute_signal_grid is not None:
+            # Compiled kernel: one pass per cell, no (ap, row, col) temporaries
+            _, max_radius_sq = self._coverage_radii(ap_locations)
+            return _compute_signal_grid(ap_x, ap_y, max_signal, path_loss, max_radius_sq, self.width,
+                                        grid_resolution, col_start, col_stop, row_start, row_stop)
+
+        # Pixel coordinates of each grid cell center
+        px = (np.arange(col_start, col_stop) * grid_resolution + grid_resolution // 2).astype(np.float32)
+        py = (np.arange(row_start, row_stop) * grid_resolution + grid_resolution // 2).astype(np.float32)
+
+        max_radius, max_radius_sq = self._coverage_radii(ap_locations)
+
+        signal_grid = np.full((len(py), len(px)), -np.inf, dtype=np.float32)
+        for i in range(len(ap_x)):
+            if max_radius[i] <= 0:
+                continue
 
-        # Initialize with very weak signal
-        signal_grid = np.full((grid_height, grid_width), -999.0)
-
-        # Calculate progress increment for each row
-        pct = 20
-        pct_increment = 80 / grid_height
-
-        # For each grid cell, calculate signal from all APs and take the strongest
-        for row in range(grid_height):
-            # Report progress for each row processed
-            if progress_callback:
-                progress_callback(int(pct), target_network)
-                pct += pct_increment
-
-            for col in range(grid_width):
-                # Convert grid coordinates to pixel coordinates (center of cell)
-                pixel_x = col * grid_resolution + grid_resolution // 2
-                pixel_y = row * grid_resolution + grid_resolution // 2
-
-                strongest_signal = -999
-
-                # Check signal strength from each AP at this location
-                for ap_location in ap_locations:
-                    signal = self._calculate_signal_at_point(
-                        ap_location, pixel_x, pixel_y
-                    )
-                    if signal > strongest_signal:
-                        strongest_signal = signal
-
-                # Only store if signal is above minimum threshold
-                if strongest_signal > -95:
-                    signal_grid[row, col] = strongest_signal
-                else:
-                    signal_grid[row, col] = np.nan  # No signal
+            # Only evaluate the cells inside this AP's bounding box
+            c0, c1 = np.searchsorted(px, [ap_x[i] - max_radius[i], ap_x[i] + max_radius[i]], side='right')
+            r0, r1 = np.searchsorted(py, [ap_y[i] - max_radius[i], ap_y[i] + max_radius[i]], side='right')
+            if c0 >= c1 or r0 >= r1:
+                continue
+
+            # Reject the box corners on squared distance before taking any sqrt
+            dx = px[None, c0:c1] - ap_x[i]
+            dy = py[r0:r1, None] - ap_y[i]
+            d2 = dx * dx + dy * dy
+            in_reach = d2 < max_radius_sq[i]
+
+            # Apply path loss model to the reachable cells and keep the strongest signal
+            tile = signal_grid[r0:r1, c0:c1]
+            signal_tile = max_signal[i] - np.sqrt(d2[in_reach]) * self._feet_per_pixel * path_loss[i]
+            tile[in_reach] = np.maximum(tile[in_reach], signal_tile)
 
         return signal_grid
 
-    def _calculate_signal_at_point(self, ap_location, x, y):
+    def _coverage_radii(self, ap_locations):
         """
-        Calculate signal strength from an AP at a specific point.
+        Radius at which each AP's signal decays to the -95 dBm cutoff
+        (same path loss model as _compute_signal_grid).
 
         Args:
-            ap_location: AP location data
-            x, y: Point coordinates
+            ap_locations: APLocations with per-AP parallel arrays
 
         Returns:
-            Signal strength in dBm
+            Tuple of (max_radius, max_radius_sq) arrays in pixels
         """
-        ap_x = ap_location['x']
-        ap_y = ap_location['y']
-        max_signal = ap_location['max_signal']
-
-        # Calculate distance in pixels
-        distance_pixels = ((x - ap_x) ** 2 + (y - ap_y) ** 2) ** 0.5
-
-        # Convert to feet
-        distance_feet = distance_pixels * (164.0 / self.width)
-
-        # Apply path loss model
-        band = ap_location.get('band', '2.4 GHz')
-        path_loss_per_foot = 0.5 if band == '2.4 GHz' else 0.6
+        max_radius = (ap_locations.max_signals + 95) / ap_locations.path_loss * self._pixels_per_foot
+        return max_radius, max_radius * max_radius
 
-        signal_loss = distance_feet * path_loss_per_foot
-        signal_at_point = max_signal - signal_loss
-
-        return signal_at_point
-
-    def _draw_signal_grid(self, painter, signal_grid):
+    def _build_heatmap_image(self, ap_locations, target_network=None, progress_callback=None):
         """
-        Draw the signal strength grid as colored rectangles.
+        Render the strongest-signal heatmap straight into a semi-transparent QImage.
+
+        Signal strength, coloring and masking are done one band of grid rows
+        at a time, so no full-size float grid is kept around.
 
         Args:
-            painter: QPainter object
-            signal_grid: 2D numpy array with signal values
+            ap_locations: APLocations with per-AP parallel arrays
+
+        Returns:
+            QImage with one grid_resolution-sized block per grid cell
         """
-        grid_resolution = 4
-        rows, cols = signal_grid.shape
+        grid_resolution = 4  # pixels per grid cell
+        grid_width = self.width // grid_resolution
+        grid_height = self.height // grid_resolution
 
-        for row in range(rows):
-            for col in range(cols):
-                signal_strength = signal_grid[row, col]
+        if progress_callback:
+            progress_callback(20, target_network)
 
-                # Skip cells with no signal
-                if np.isnan(signal_strength):
-                    continue
+        width = grid_width * grid_resolution
+        height = grid_height * grid_resolution
 
-                # Get color for this signal strength
-                color = self._signal_to_color_gradient(signal_strength)
-                color.setAlpha(150)  # Semi-transparent for blending
+        # Every row band is overwritten below, so a buffer of the same size can be reused
+        if self._buf_cache is None or self._buf_cache[0] != (width, height):
+            self._buf_cache = ((width, height), np.empty((height, width, 4), dtype=np.uint8))
+        buf = self._buf_cache[1]
 
-                # Calculate pixel position
-                x = col * grid_resolution
-                y = row * grid_resolution
+        self._render_heatmap_cells(ap_locations, (0, 0, grid_width, grid_height), grid_resolution, buf)
 
-                # Draw filled rectangle
-                painter.setBrush(QBrush(color))
-                painter.setPen(Qt.NoPen)
-                painter.drawRect(x, y, grid_resolution, grid_resolution)
+        # QImage does not own the pixel data; _buf_cache keeps the buffer alive
+        return QImage(buf.data, width, height, width * 4, QImage.Format_RGBA8888)
 
-    def _draw_ap_coverage_circles(self, painter: QPainter, ap_location: dict):
+    def _render_heatmap_cells(self, ap_locations, cells, grid_resolution, buf):
         """
-        Draw gradient coverage circles around an AP with smooth color transitions.
+        Color a block of grid cells into an RGBA pixel buffer.
 
         Args:
-            painter: QPainter object to draw with
-            ap_location: AP location data with coordinates and signal info
-        """
-        ap_x = ap_location['x']
-        ap_y = ap_location['y']
-        max_signal = ap_location['max_signal']
-
-        # Calculate maximum radius (where signal drops to -90 dBm)
-        band = ap_location.get('band', '2.4 GHz')
-        path_loss_per_foot = 0.5 if band == '2.4 GHz' else 0.6
-
-        max_signal_drop = max_signal - (-90)  # Drop to -90 dBm
-        max_distance_feet = abs(max_signal_drop) / path_loss_per_foot
-        max_radius_pixels = max_distance_feet * (self.width / 164.0)
-
-        # Don't draw if radius is too large
-        if max_radius_pixels > max(self.width, self.height):
-            max_radius_pixels = max(self.width, self.height)
-
-        # Draw concentric circles with gradient from center outward
-        # Use many small rings to create smooth gradient effect
-        num_rings = int(max_radius_pixels / 5)  # Ring every 5 pixels
-
-        for ring in range(num_rings, 0, -1):  # Draw from outside to inside
-            radius_pixels = (ring / num_rings) * max_radius_pixels
-
-            # Calculate signal strength at this distance
-            distance_feet = radius_pixels * (164.0 / self.width)
-            signal_loss = distance_feet * path_loss_per_foot
-            signal_at_distance = max_signal - signal_loss
-
-            # Clamp signal to reasonable range
-            signal_at_distance = max(-95, min(-20, signal_at_distance))
-
-            # Get color for this signal strength with gradient interpolation
-            color = self._signal_to_color_gradient(signal_at_distance)
-
-            # Make rings more transparent toward edges for smooth blending
-            base_alpha = 120  # Base transparency
-            edge_factor = 1.0 - (ring / num_rings)  # 0 at edge, 1 at center
-            alpha = int(base_alpha * (0.3 + 0.7 * edge_factor))  # 30% to 100% of base
-            color.setAlpha(alpha)
-
-            # Draw ring (filled circle)
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(
-                int(ap_x - radius_pixels),
-                int(ap_y - radius_pixels),
-                int(radius_pixels * 2),
-                int(radius_pixels * 2)
-            )
+            ap_locations: APLocations with per-AP parallel arrays
+            cells: (col_start, row_start, col_stop, row_stop) grid cells to render
+            grid_resolution: Pixels per grid cell
+            buf: uint8 array of shape (rows * grid_resolution, cols * grid_resolution, 4)
+        """
+        block_rows = 32  # grid rows per band
+        col_start, first_row, col_stop, last_row = cells
+
+        for row_start in range(first_row, last_row, block_rows):
+            row_stop = min(row_start + block_rows, last_row)
+            signal = self._compute_signal_rows(ap_locations, row_start, row_stop, grid_resolution,
+                                               col_start, col_stop)
+
+            # Color the band using the same gradient as _signal_to_color_gradient
+            no_signal = signal <= -95
+            rgba = self._signal_to_rgba_array(np.maximum(signal, -95))
+            rgba[..., 3] = 150  # Semi-transparent for blending
+            rgba[no_signal] = 0  # Skip cells with no signal
+
+            # Expand each cell to grid_resolution x grid_resolution pixels
+            buf[(row_start - first_row) * grid_resolution:(row_stop - first_row) * grid_resolution] = np.repeat(
+                np.repeat(rgba, grid_resolution, axis=0), grid_resolution, axis=1)
 
     def _is_primary_network_bssid(self, bssid: str, target_network: str) -> bool:
         """
@@ -598,12 +677,28 @@ class HeatmapGenerator:
         Returns:
             QColor for the given signal strength
         """
-        for min_signal, max_signal, color in self.SIGNAL_RANGES:
-            if max_signal <= signal_strength <= min_signal:
-                return color
+        # Same band edges as the vectorized paths; NaN maps to the default blue
+        return self._range_colors[int(self._signal_range_indices(signal_strength))]
+
+    def _signal_range_indices(self, signal):
+        """
+        Find the SIGNAL_RANGES band for each signal strength.
+
+        Args:
+            signal: Signal strength in dBm (scalar or numpy array)
+
+        Returns:
+            uint8 index into SIGNAL_RANGES for each value
+        """
+        signal = np.asarray(signal)
+
+        # Number of band edges at or below each signal, counted from the
+        # strongest band down so the result indexes SIGNAL_RANGES directly
+        weakest_index = len(self._range_max) - 1
+        indices = (weakest_index - np.searchsorted(self._bin_edges, signal, side='right')).astype(np.uint8)
 
-        # Default to blue for very weak signals
-        return self.SIGNAL_RANGES[-1][2]  # Blue
+        # Signals stronger than the top range (and NaN) default to blue
+        return np.where(signal <= self._range_min[0], indices, np.uint8(weakest_index))
 
     def _signal_to_color_gradient(self, signal_strength: float) -> QColor:
         """
@@ -615,6 +710,31 @@ class HeatmapGenerator:
         Returns:
             QColor with interpolated color based on signal strength
         """
+        # Look up the precomputed gradient (one entry per dBm from -15 to -95)
+        idx = min(80, max(0, int(-signal_strength) - 15))
+        return QColor(*self._color_lut[idx, :3].tolist())
+
+    def _signal_to_rgba_array(self, signal):
+        """
+        Map an array of signal strengths to RGBA colors in a single lookup.
+
+        Args:
+            signal: numpy array of signal strengths in dBm (no NaNs)
+
+        Returns:
+            uint8 array with a trailing RGBA axis, same gradient as
+            _signal_to_color_gradient
+        """
+        idx = np.clip((-signal).astype(int) - 15, 0, 80)
+        return self._color_lut[idx]
+
+    def _build_color_lut(self) -> np.ndarray:
+        """
+        Precompute the signal gradient for every dBm from -15 to -95.
+
+        Returns:
+            (81, 4) uint8 RGBA table indexed by -signal_dBm - 15
+        """
         # Define color points for smooth interpolation
         # Format: (signal_dBm, red, green, blue)
         color_points = [
@@ -625,29 +745,29 @@ class HeatmapGenerator:
             (-90, 0, 0, 255),     # Blue (very poor)
         ]
 
-        # Clamp signal to our range
-        signal_strength = max(-95, min(-15, signal_strength))
+        lut = np.zeros((81, 4), dtype=np.uint8)
+        for idx in range(81):
+            signal_strength = -15 - idx
 
-        # Find the two color points to interpolate between
-        for i in range(len(color_points) - 1):
-            signal1, r1, g1, b1 = color_points[i]
-            signal2, r2, g2, b2 = color_points[i + 1]
+            # Fallback to blue for signals outside the color points
+            r, g, b = 0, 0, 255
 
-            if signal1 >= signal_strength >= signal2:
-                # Linear interpolation between the two points
-                if signal1 == signal2:
-                    factor = 0
-                else:
-                    factor = (signal_strength - signal2) / (signal1 - signal2)
+            # Find the two color points to interpolate between
+            for i in range(len(color_points) - 1):
+                signal1, r1, g1, b1 = color_points[i]
+                signal2, r2, g2, b2 = color_points[i + 1]
 
-                r = int(r2 + factor * (r1 - r2))
-                g = int(g2 + factor * (g1 - g2))
-                b = int(b2 + factor * (b1 - b2))
+                if signal1 >= signal_strength >= signal2:
+                    # Linear interpolation between the two points
+                    factor = (signal_strength - signal2) / (signal1 - signal2)
+                    r = int(r2 + factor * (r1 - r2))
+                    g = int(g2 + factor * (g1 - g2))
+                    b = int(b2 + factor * (b1 - b2))
+                    break
 
-                return QColor(r, g, b)
+            lut[idx] = (r, g, b, 255)
 
-        # Fallback to blue for very weak signals
-        return QColor(0, 0, 255)
+        return lut
 
     def _create_empty_heatmap(self) -> QPixmap:
         """Create empty transparent heatmap."""
@@ -670,41 +790,31 @@ class HeatmapGenerator:
             return []
 
         # Count network appearances and track signal strengths
-        network_stats: Dict[str, List[float]] = {}
-
-        for scan_point in scan_points:
-            for ap in scan_point.ap_list:
-                if ap.ssid not in network_stats:
-                    network_stats[ap.ssid] = []
-                network_stats[ap.ssid].append(ap.signal_strength)
-
-        # Rank networks by coverage and signal strength
-        network_scores = []
-        total_scan_points = len(scan_points)
+        _, ssids, _, signals, _, _, _ = self._scan_points_to_soa(scan_points)
+        if not len(ssids):
+            return []
 
-        for ssid, signals in network_stats.items():
-            coverage_ratio = len(signals) / total_scan_points
-            avg_signal = np.mean(signals)
-            max_signal = max(signals)
+        network_ssids, inverse = np.unique(ssids, return_inverse=True)
+        counts = np.bincount(inverse)
+        avg_signals = np.bincount(inverse, weights=signals) / counts
 
-            # Score based on coverage, average strength, and peak strength
-            score = (coverage_ratio * 0.5 +
-                    (avg_signal + 100) / 100 * 0.3 +  # Normalize dBm to 0-1 range
-                    (max_signal + 100) / 100 * 0.2)
+        # Peak per SSID: group the signals by SSID, then reduce each contiguous run
+        grouped_signals = signals[np.argsort(inverse, kind='stable')]
+        max_signals = np.maximum.reduceat(grouped_signals, np.cumsum(counts) - counts)
 
-            network_scores.append((score, ssid))
+        # Rank networks by coverage and signal strength:
+        # score based on coverage, average strength, and peak strength
+        coverage = counts / len(scan_points)
+        scores = (coverage * 0.5 +
+                  (avg_signals + 100) / 100 * 0.3 +  # Normalize dBm to 0-1 range
+                  (max_signals + 100) / 100 * 0.2)
 
-        # Sort by score and return top networks
-        network_scores.sort(reverse=True)
+        # Sort by score, highest first (ties by SSID, descending)
+        reverse_ssids = np.arange(len(network_ssids))[::-1]
+        ranking = reverse_ssids[np.argsort(-scores[reverse_ssids], kind='stable')]
 
         # Return networks with significant presence (>= 30% coverage)
-        connected_networks = []
-        for score, ssid in network_scores:
-            coverage = len(network_stats[ssid]) / total_scan_points
-            if coverage >= 0.3:  # At least 30% coverage
-                connected_networks.append(ssid)
-
-        return connected_networks
+        return [network_ssids[i] for i in ranking if coverage[i] >= 0.3]
 
     def create_legend_pixmap(self, width: int = 200, height: int = 300) -> QPixmap:
         """
@@ -807,8 +917,12 @@ class HeatmapGenerator:
         Returns:
             List of interfering source locations with estimated coordinates and power
         """
-        # Collect all measurements for each interfering device
-        device_measurements = {}  # device_id -> [(x, y, rssi, ssid)]
+        # Collect all measurements for each interfering device. Device IDs and
+        # SSIDs are interned to small ints so only numbers travel with each
+        # measurement; names are mapped back once for the returned sources.
+        device_measurements = defaultdict(list)  # device_idx -> [(x, y, rssi, ssid_idx)]
+        device_table = {}  # device_id -> device_idx
+        ssid_table = {}  # ssid -> ssid_idx
 
         # Identify target device IDs first
         target_device_ids = set()
@@ -838,23 +952,27 @@ class HeatmapGenerator:
                             strongest_network = network
 
                 if strongest_network:
-                    if device_id not in device_measurements:
-                        device_measurements[device_id] = []
+                    device_idx = device_table.setdefault(device_id, len(device_table))
+                    ssid_idx = ssid_table.setdefault(strongest_network.ssid, len(ssid_table))
 
-                    device_measurements[device_id].append((
+                    device_measurements[device_idx].append((
                         scan_point.map_x,
                         scan_point.map_y,
                         strongest_network.signal_strength,
-                        strongest_network.ssid
+                        ssid_idx
                     ))
 
+        # Reverse lookup for the SSIDs that end up on returned sources
+        ssid_names = {ssid_idx: ssid for ssid, ssid_idx in ssid_table.items()}
+
         # Triangulate source location for each interfering device
         interfering_sources = []
-        for device_id, measurements in device_measurements.items():
+        for device_idx, measurements in device_measurements.items():
             # Only triangulate if we have enough measurements for reliable positioning
             if len(measurements) >= 3:  # Need at least 3 points for real triangulation
                 source_location = self._estimate_interference_source_location(measurements)
                 if source_location:
+                    source_location['ssid'] = ssid_names[source_location['ssid']]
                     interfering_sources.append(source_location)
             # Skip single/dual measurements - not enough data for reliable external positioning
             # Single measurements could be anywhere, dual measurements lack directional certainty
@@ -874,30 +992,40 @@ class HeatmapGenerator:
         if len(measurements) < 3:
             return None
 
-        import numpy as np
+        # Convert once to contiguous arrays shared by every helper below
+        count = len(measurements)
+        xs = np.fromiter((m[0] for m in measurements), dtype=np.float64, count=count)
+        ys = np.fromiter((m[1] for m in measurements), dtype=np.float64, count=count)
+        rssis = np.fromiter((m[2] for m in measurements), dtype=np.float64, count=count)
 
-        # Sort measurements by signal strength
-        sorted_measurements = sorted(measurements, key=lambda m: m[2], reverse=True)
-        max_rssi = sorted_measurements[0][2]
+        # Strongest measurement is the closest to the source
+        closest_measurement = measurements[int(np.argmax(rssis))]
+        max_rssi = closest_measurement[2]
         ssid = measurements[0][3]  # Use SSID from first measurement
 
         # Analyze signal gradient to determine probable source direction
         # Filter out potential NLOS anomalies by looking at signal patterns
-        valid_measurements = self._filter_nlos_measurements(measurements)
+        valid_xs, valid_ys, valid_rssis = self._filter_nlos_measurements(xs, ys, rssis)
 
-        if len(valid_measurements) < 3:
+        if len(valid_xs) < 3:
             # Fall back to all measurements if filtering removes too many
-            valid_measurements = measurements
+            valid_xs, valid_ys, valid_rssis = xs, ys, rssis
 
-        # Determine source location based on signal gradient analysis
-        source_direction = self._analyze_signal_gradient(valid_measurements)
+        # Determine source location based on signal gradient analysis. With few
+        # measurements the quadrant averages are unreliable, so let
+        # _triangulate_external_source use its nearest-boundary fallback instead
+        if len(valid_xs) >= 6:
+            source_direction = self._analyze_signal_gradient(valid_xs, valid_ys, valid_rssis)
+        else:
+            source_direction = None
 
         # Use proper triangulation to find EXTERNAL source location
         # The key insight: interference sources are OUTSIDE the measurement area
-        estimated_x, estimated_y = self._triangulate_external_source(valid_measurements, source_direction)
+        estimated_x, estimated_y = self._triangulate_external_source(
+            valid_xs, valid_ys, valid_rssis, source_direction
+        )
 
         # Estimate transmit power based on strongest received signal and distance
-        closest_measurement = max(measurements, key=lambda m: m[2])
         distance_to_closest = ((estimated_x - closest_measurement[0])**2 + (estimated_y - closest_measurement[1])**2)**0.5
 
         # Indoor path loss model accounting for physical obstructions
@@ -916,93 +1044,95 @@ class HeatmapGenerator:
             'max_rssi': max_rssi
         }
 
-    def _filter_nlos_measurements(self, measurements):
+    def _filter_nlos_measurements(self, xs, ys, rssis):
         """
         Filter out potential NLOS measurements that might be anomalous due to reflections.
 
-        Returns measurements that follow expected propagation patterns.
-        """
-        if len(measurements) < 5:
-            return measurements  # Too few points to filter reliably
+        Args:
+            xs, ys, rssis: Coordinate and signal arrays for all measurements
 
-        import numpy as np
+        Returns:
+            (xs, ys, rssis) arrays of measurements that follow expected propagation patterns
+        """
+        if len(xs) < 5:
+            return xs, ys, rssis  # Too few points to filter reliably
 
         # Calculate median signal strength
-        signals = [rssi for _, _, rssi, _ in measurements]
-        median_signal = np.median(signals)
+        median_signal = np.median(rssis)
+
+        # Common case: nothing is suspiciously strong, so nothing to filter
+        if rssis.max() <= median_signal + 15:
+            return xs, ys, rssis
 
         # Filter out measurements that are significantly stronger than expected
-        # based on their position relative to the signal gradient
-        filtered = []
-        for measurement in measurements:
-            x, y, rssi, ssid = measurement
+        # based on their position relative to the signal gradient.
+        # Allow measurements within reasonable range of median
+        # or weaker measurements (which are more likely to be legitimate)
+        keep = rssis <= median_signal + 15  # Allow up to 15dB above median
+
+        # For very strong signals, only keep if they fit the pattern
+        # This helps exclude window reflections and other NLOS effects
+        for idx in np.flatnonzero(~keep):
+            keep[idx] = self._fits_propagation_pattern(idx, xs, ys, rssis)
 
-            # Allow measurements within reasonable range of median
-            # or weaker measurements (which are more likely to be legitimate)
-            if rssi <= median_signal + 15:  # Allow up to 15dB above median
-                filtered.append(measurement)
-            elif rssi > median_signal + 15:
-                # For very strong signals, only keep if they fit the pattern
-                # This helps exclude window reflections and other NLOS effects
-                if self._fits_propagation_pattern(measurement, measurements):
-                    filtered.append(measurement)
+        if np.count_nonzero(keep) < 3:
+            return xs, ys, rssis
 
-        return filtered if len(filtered) >= 3 else measurements
+        return xs[keep], ys[keep], rssis[keep]
 
-    def _fits_propagation_pattern(self, test_measurement, all_measurements):
+    def _fits_propagation_pattern(self, test_idx, xs, ys, rssis):
         """
         Check if a measurement fits expected RF propagation patterns.
-        """
-        x, y, rssi, _ = test_measurement
 
-        # Look for nearby measurements to validate the signal strength
-        nearby_measurements = []
-        for mx, my, mrssi, _ in all_measurements:
-            distance = ((x - mx)**2 + (y - my)**2)**0.5
-            if 50 <= distance <= 200:  # Look at measurements 50-200 pixels away
-                nearby_measurements.append((distance, mrssi))
+        Args:
+            test_idx: Index of the measurement to check
+            xs, ys, rssis: Coordinate and signal arrays for all measurements
 
-        if not nearby_measurements:
-            return True  # Can't validate, so allow it
+        Returns:
+            True if the measurement is plausible for its position
+        """
+        # Look at measurements 50-200 pixels away to validate the signal strength
+        distances = np.hypot(xs - xs[test_idx], ys - ys[test_idx])
+        nearby = (distances >= 50) & (distances <= 200)
 
-        # Check if signal strength follows expected distance relationship
-        for distance, nearby_rssi in nearby_measurements:
-            # Expect signal to decrease with distance (basic sanity check)
-            expected_loss = 20 * np.log10(distance / 50)  # Rough estimate
-            if rssi > nearby_rssi + expected_loss + 10:  # Allow 10dB tolerance
-                return False  # This measurement seems too strong for its position
+        if not nearby.any():
+            return True  # Can't validate, so allow it
 
-        return True
+        # Expect signal to decrease with distance (basic sanity check), with a
+        # 10dB tolerance on top of the rough path loss estimate
+        expected_loss = 20 * np.log10(distances[nearby] / 50)
+        return not np.any(rssis[test_idx] > rssis[nearby] + expected_loss + 10)
 
-    def _analyze_signal_gradient(self, measurements):
+    def _analyze_signal_gradient(self, xs, ys, rssis):
         """
         Analyze signal strength gradient to determine likely source direction.
 
+        Args:
+            xs, ys, rssis: Coordinate and signal arrays for all measurements
+
         Returns direction vector (dx, dy) pointing toward probable source location.
         """
-        import numpy as np
-
-        if len(measurements) < 4:
+        if len(xs) < 4:
             return None
 
         # Calculate centroid of measurements
-        center_x = np.mean([x for x, _, _, _ in measurements])
-        center_y = np.mean([y for _, y, _, _ in measurements])
+        center_x = xs.mean()
+        center_y = ys.mean()
 
         # Analyze signal strength vs position to find gradient
         # Look for patterns like "stronger signals in the north" or "stronger signals to the east"
 
         # Split measurements into regions and compare average signal strengths
-        north_signals = [rssi for x, y, rssi, _ in measurements if y < center_y]
-        south_signals = [rssi for x, y, rssi, _ in measurements if y > center_y]
-        east_signals = [rssi for x, y, rssi, _ in measurements if x > center_x]
-        west_signals = [rssi for x, y, rssi, _ in measurements if x < center_x]
+        north_signals = rssis[ys < center_y]
+        south_signals = rssis[ys > center_y]
+        east_signals = rssis[xs > center_x]
+        west_signals = rssis[xs < center_x]
 
         # Calculate average signals for each direction
-        avg_north = np.mean(north_signals) if north_signals else -100
-        avg_south = np.mean(south_signals) if south_signals else -100
-        avg_east = np.mean(east_signals) if east_signals else -100
-        avg_west = np.mean(west_signals) if west_signals else -100
+        avg_north = north_signals.mean() if north_signals.size else -100
+        avg_south = south_signals.mean() if south_signals.size else -100
+        avg_east = east_signals.mean() if east_signals.size else -100
+        avg_west = west_signals.mean() if west_signals.size else -100
 
         # Determine direction with strongest signals
         dx = 0
@@ -1024,47 +1154,38 @@ class HeatmapGenerator:
 
         return (dx, dy) if (dx != 0 or dy != 0) else None
 
-    def _triangulate_external_source(self, measurements, direction):
+    def _triangulate_external_source(self, xs, ys, rssis, direction):
         """
         Triangulate interference source location OUTSIDE the measurement area.
 
         This is the key fix: interference sources are external APs, not at scan points.
-        """
-        import numpy as np
 
-        if len(measurements) < 3:
+        Args:
+            xs, ys, rssis: Coordinate and signal arrays for all measurements
+            direction: (dx, dy) toward the source, or None to infer from boundaries
+        """
+        if len(xs) < 3:
             return None, None
 
         # Find the boundary of measurement area
-        all_x = [x for x, _, _, _ in measurements]
-        all_y = [y for _, y, _, _ in measurements]
-
-        min_x, max_x = min(all_x), max(all_x)
-        min_y, max_y = min(all_y), max(all_y)
+        min_x, max_x = xs.min(), xs.max()
+        min_y, max_y = ys.min(), ys.max()
 
         # Find measurements with strongest signals - these are closest to the source
-        sorted_measurements = sorted(measurements, key=lambda m: m[2], reverse=True)
-
         # Use the top 3 strongest measurements for triangulation
-        top_measurements = sorted_measurements[:3]
+        top = np.argsort(-rssis, kind='stable')[:3]
+        top_xs, top_ys, top_rssis = xs[top], ys[top], rssis[top]
 
         # Calculate weighted centroid of strongest measurements
-        total_weight = 0
-        weighted_x = 0
-        weighted_y = 0
-
-        for x, y, rssi, _ in top_measurements:
-            # Strong exponential weighting - strongest signals dominate
-            weight = pow(10, (rssi + 100) / 20)  # Convert dBm to linear-ish scale
-            weighted_x += x * weight
-            weighted_y += y * weight
-            total_weight += weight
+        # Strong exponential weighting - strongest signals dominate
+        weights = 10 ** ((top_rssis + 100) / 20)  # Convert dBm to linear-ish scale
+        total_weight = weights.sum()
 
         if total_weight == 0:
             return None, None
 
-        centroid_x = weighted_x / total_weight
-        centroid_y = weighted_y / total_weight
+        centroid_x = (top_xs * weights).sum() / total_weight
+        centroid_y = (top_ys * weights).sum() / total_weight
 
         # Determine which edge the source is closest to based on signal pattern
         # The source should be OUTSIDE the measurement area
@@ -1073,7 +1194,7 @@ class HeatmapGenerator:
             dx, dy = direction
         else:
             # Fallback: use strongest measurement to estimate direction
-            strongest_x, strongest_y = top_measurements[0][0], top_measurements[0][1]
+            strongest_x, strongest_y = top_xs[0], top_ys[0]
 
             # Determine which boundary the strongest signal is closest to
             to_left = strongest_x - min_x
@@ -1094,7 +1215,7 @@ class HeatmapGenerator:
 
         # Calculate distance to place source outside measurement area
         # Stronger signals = source is closer to boundary
-        strongest_rssi = top_measurements[0][2]
+        strongest_rssi = top_rssis[0]
 
         if strongest_rssi > -40:
             # Very strong signal - source is just outside boundary
@@ -1154,11 +1275,10 @@ class HeatmapGenerator:
             estimated_distance = 150  # pixels
 
         # Place source slightly offset from measurement point
-        # Use a random direction to avoid clustering
-        import random
-        import math
-
-        angle = random.uniform(0, 2 * math.pi)
+        # Step around the circle by the golden angle so successive sources spread
+        # out evenly (and reproducibly) instead of clustering
+        self._edge_angle_idx += 1
+        angle = (self._edge_angle_idx * 2.39996322972865332) % (2 * math.pi)
         source_x = x + estimated_distance * math.cos(angle)
         source_y = y + estimated_distance * math.sin(angle)
 
@@ -1228,7 +1348,6 @@ class HeatmapGenerator:
         estimated_y = stronger_y + dy * extrapolation_factor
 
         # Estimate transmit power
-        import math
         distance_to_stronger = distance_between * extrapolation_factor
         estimated_path_loss = 40 * math.log10(max(distance_to_stronger / 100, 0.1)) + 40
         estimated_tx_power = stronger_rssi + estimated_path_loss
@@ -1290,6 +1409,9 @@ class HeatmapGenerator:
         """
         Create interference heatmap with contiguous coverage areas from each source.
         """
+        if self.use_numpy_interference_renderer:
+            return self._render_interference_numpy(coverage_sources, status_callback)
+
         pixmap = QPixmap(self.width, self.height)
         pixmap.fill(Qt.transparent)
 
@@ -1297,10 +1419,18 @@ class HeatmapGenerator:
         painter.setRenderHint(QPainter.Antialiasing, True)
         painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
 
-        import math
-
         total_sources = len(coverage_sources)
 
+        # Draw concentric circles with decreasing transparency (contiguous coverage)
+        num_rings = self.INTERFERENCE_RINGS
+
+        # Ring geometry is the same for every source, so compute it once
+        ring_indices = np.arange(num_rings, 0, -1)  # Draw from outside to inside
+        ring_radii_frac = ring_indices / num_rings
+        # Closer = higher interference: 0 at edge, 1 at center
+        distance_factor = 1.0 - ring_radii_frac
+        base_interf = 60.0 * distance_factor  # Max 60% interference at center
+
         for source_idx, source in enumerate(coverage_sources):
             # Report progress
             if status_callback:
@@ -1312,20 +1442,12 @@ class HeatmapGenerator:
             max_radius = source['max_radius']
             falloff_rate = source['falloff_rate']
 
-            # Draw concentric circles with decreasing transparency (contiguous coverage)
-            num_rings = 8  # Number of concentric rings for smooth coverage
-
-            for ring in range(num_rings, 0, -1):  # Draw from outside to inside
-                # Calculate ring radius and interference level
-                radius = max_radius * (ring / num_rings)
+            # Apply falloff rate to every ring in one vectorized operation
+            levels = base_interf * (falloff_rate ** (ring_indices - 1))
 
-                # Calculate interference level based on distance from source
-                # Closer = higher interference
-                distance_factor = 1.0 - (ring / num_rings)  # 0 at edge, 1 at center
-                base_interference = 60 * distance_factor  # Max 60% interference at center
-
-                # Apply falloff rate
-                interference_level = base_interference * (falloff_rate ** (ring - 1))
+            for radius_frac, interference_level in zip(ring_radii_frac, levels):
+                # Calculate ring radius
+                radius = max_radius * radius_frac
 
                 # Skip very weak interference to avoid cluttering
                 if interference_level < 2:
@@ -1353,6 +1475,94 @@ class HeatmapGenerator:
         painter.end()
         return pixmap
 
+    def _render_interference_numpy(self, coverage_sources: List[dict],
+                                   status_callback=None) -> QPixmap:
+        """
+        Render the interference heatmap into a single RGBA pixel buffer.
+
+        Produces the same ring geometry as the QPainter renderer, but each pixel
+        takes the strongest interference level of any source covering it and is
+        colored with one lookup-table gather at the end.
+
+        Args:
+            coverage_sources: Sources from _calculate_interference_coverage
+            status_callback: Progress callback function
+
+        Returns:
+            QPixmap with interference visualization
+        """
+        num_rings = self.INTERFERENCE_RINGS
+        ring_indices = np.arange(num_rings + 1)
+        distance_factor = 1.0 - ring_indices / num_rings
+
+        level_grid = np.zeros((self.height, self.width), dtype=np.float32)
+        total_sources = len(coverage_sources)
+
+        for source_idx, source in enumerate(coverage_sources):
+            # Report progress
+            if status_callback:
+                progress = int((source_idx / total_sources) * 100)
+                status_callback(progress, "interference")
+
+            source_x = source['x']
+            source_y = source['y']
+            max_radius = source['max_radius']
+
+            # Only touch pixels inside the source's bounding box on the map
+            x0 = max(0, int(source_x - max_radius))
+            x1 = min(self.width, int(source_x + max_radius) + 1)
+            y0 = max(0, int(source_y - max_radius))
+            y1 = min(self.height, int(source_y + max_radius) + 1)
+            if x0 >= x1 or y0 >= y1:
+                continue
+
+            # Interference level of each ring (index 0 unused)
+            ring_levels = (60.0 * distance_factor *
+                           source['falloff_rate'] ** (ring_indices - 1)).astype(np.float32)
+            ring_levels[ring_levels < 2] = 0  # Skip very weak interference
+
+            yy, xx = np.ogrid[y0:y1, x0:x1]
+            ring_scale = num_rings / max_radius
+            if ne is not None:
+                r2 = ne.evaluate('(xx - sx)**2 + (yy - sy)**2',
+                                 local_dict={'xx': xx, 'yy': yy,
+                                             'sx': source_x, 'sy': source_y})
+                ring_pos = ne.evaluate('sqrt(r2) * k', local_dict={'r2': r2, 'k': ring_scale})
+            else:
+                r2 = (xx - source_x) ** 2 + (yy - source_y) ** 2
+                ring_pos = np.sqrt(r2) * ring_scale
+
+            # Innermost ring covering each pixel is the one drawn on top
+            ring = np.ceil(ring_pos).astype(np.intp)
+            np.clip(ring, 1, num_rings, out=ring)
+            levels = np.where(r2 < max_radius * max_radius, ring_levels[ring], 0)
+
+            tile = level_grid[y0:y1, x0:x1]
+            np.maximum(tile, levels, out=tile)
+
+        # Color every pixel at once; thresholds are integers so round up
+        lut_idx = np.ceil(np.clip(level_grid, 0, 100)).astype(np.intp)
+        buf = self._interference_lut[lut_idx]
+        buf[level_grid < 2] = 0
+
+        image = QImage(buf.data, self.width, self.height, self.width * 4,
+                       QImage.Format_RGBA8888)
+        # fromImage converts into the pixmap's own storage while buf is alive
+        return QPixmap.fromImage(image)
+
+    def _build_interference_lut(self) -> np.ndarray:
+        """
+        Build an RGBA lookup table for integer interference levels 0-100.
+
+        Returns:
+            (101, 4) uint8 array of colors from _interference_level_to_color
+        """
+        lut = np.zeros((101, 4), dtype=np.uint8)
+        for level in range(101):
+            color = self._interference_level_to_color(level)
+            lut[level] = (color.red(), color.green(), color.blue(), color.alpha())
+        return lut
+
     def _interference_level_to_color(self, interference_level: float) -> QColor:
         """
         Map interference level (0-100) to transparent color.
@@ -12,7 +12,49 @@
 # -----------------------------------------------------------------------------
 
 import os
+import functools
 import locale
+import logging
+
+# Status messages go to logging (silent at the default WARNING level)
+# rather than print, which blocks the GUI thread on the stdout flush
+_log = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_system_language_cached():
+    """
+    Detects the system language from environment variables, once per process.
+
+    Returns:
+        str: The detected language code, defaults to 'en_US'.
+    """
+    # Try various environment variables in order of preference
+    for env_var in ['LANG', 'LC_ALL', 'LC_MESSAGES', 'LANGUAGE']:
+        lang = os.environ.get(env_var)
+        if lang:
+            # Extract language code (e.g., 'en_US.UTF-8' -> 'en_US')
+            lang = lang.split('.')[0].split('@')[0]
+            if '_' in lang:
+                return lang
+            elif '-' in lang:
+                # Convert 'en-US' to 'en_US'
+                return lang.replace('-', '_')
+            else:
+                # Just language code like 'en' -> 'en_US'
+                return f"{lang}_US" if lang == 'en' else f"{lang}_{lang.upper()}"
+
+    # Fallback: try Python's locale detection
+    try:
+        system_locale = locale.getdefaultlocale()[0]
+        if system_locale:
+            return system_locale
+    except:
+        pass
+
+    # Final fallback
+    return "en_US"
+
 
 class I18nManager:
     """
@@ -31,8 +73,9 @@ class I18nManager:
         self.lang_code = lang_code or self._detect_system_language()
         self.i18n_dir = i18n_dir
         self.translations = {}
+        self._cache = {}  # Parsed translations per file path, reused on language changes
         self._load_translations()
-        print(f"I18nManager initialized with language: {self.lang_code} from {self.i18n_dir}")
+        _log.debug("I18nManager initialized with language: %s from %s", self.lang_code, self.i18n_dir)
 
     def _detect_system_language(self):
         """
@@ -41,31 +84,9 @@ class I18nManager:
         Returns:
             str: The detected language code, defaults to 'en_US'.
         """
-        # Try various environment variables in order of preference
-        for env_var in ['LANG', 'LC_ALL', 'LC_MESSAGES', 'LANGUAGE']:
-            lang = os.environ.get(env_var)
-            if lang:
-                # Extract language code (e.g., 'en_US.UTF-8' -> 'en_US')
-                lang = lang.split('.')[0].split('@')[0]
-                if '_' in lang:
-                    return lang
-                elif '-' in lang:
-                    # Convert 'en-US' to 'en_US'
-                    return lang.replace('-', '_')
-                else:
-                    # Just language code like 'en' -> 'en_US'
-                    return f"{lang}_US" if lang == 'en' else f"{lang}_{lang.upper()}"
-
-        # Fallback: try Python's locale detection
-        try:
-            system_locale = locale.getdefaultlocale()[0]
-            if system_locale:
-                return system_locale
-        except:
-            pass
-
-        # Final fallback
-        return "en_US"
+        # The environment and locale do not change while the app runs, so the
+        # scan (and locale.getdefaultlocale) only happens for the first instance
+        return _detect_system_language_cached()
 
     def _load_translations(self):
         """
@@ -81,16 +102,16 @@ class I18nManager:
             self._load_translation_file(filepath)
         elif self.lang_code != "en_US":
             # Fallback to en_US if preferred language doesn't exist
-            print(f"Warning: Translation file not found: {filepath}")
+            _log.warning("Translation file not found: %s", filepath)
             fallback_path = os.path.join(self.i18n_dir, "en_US.txt")
             if os.path.exists(fallback_path):
-                print(f"Falling back to en_US translations")
+                _log.warning("Falling back to en_US translations")
                 self._load_translation_file(fallback_path)
                 self.lang_code = "en_US"  # Update to reflect actual loaded language
             else:
-                print(f"Error: No translation files found in {self.i18n_dir}")
+                _log.error("No translation files found in %s", self.i18n_dir)
         else:
-            print(f"Error: en_US translation file not found: {filepath}")
+            _log.error("en_US translation file not found: %s", filepath)
 
     def _load_translation_file(self, filepath):
         """
@@ -99,16 +120,25 @@ class I18nManager:
         Args:
             filepath (str): Path to the translation file to load.
         """
+        # Reuse translations parsed earlier (e.g. switching back to a language)
+        if filepath in self._cache:
+            self.translations.update(self._cache[filepath])
+            return
+
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and '=' in line and not line.startswith('#'):
-                        key, value = line.split('=', 1)
-                        self.translations[key.strip()] = value.strip()
-            print(f"Loaded translations from: {filepath}")
+                text = f.read()
+
+            # Parse all 'key=value' lines at once, skipping blanks and comments
+            lines = (line.strip() for line in text.splitlines())
+            pairs = (line.split('=', 1) for line in lines if '=' in line and not line.startswith('#'))
+            translations = {key.strip(): value.strip() for key, value in pairs}
+
+            self._cache[filepath] = translations
+            self.translations.update(translations)
+            _log.debug("Loaded translations from: %s", filepath)
         except Exception as e:
-            print(f"Error loading translations from {filepath}: {e}")
+            _log.error("Error loading translations from %s: %s", filepath, e)
 
     def get_string(self, key):
         """
@@ -133,4 +163,4 @@ class I18nManager:
             self.lang_code = new_lang_code
             self.translations = {} # Clear old translations
             self._load_translations()
-            print(f"Language changed to: {self.lang_code}")
+            _log.debug("Language changed to: %s", self.lang_code)
@@ -13,16 +13,117 @@
 # -----------------------------------------------------------------------------
 
 import datetime
+import html
+import logging
+import time
+import numpy as np
+from scipy.spatial import cKDTree
 # import random  # Removed - no longer needed without simulation fallback
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QMessageBox, QInputDialog, QMenu, QAction, QDialog, QScrollArea, QPushButton, QApplication, QFormLayout, QLineEdit
-from PyQt5.QtCore import Qt, pyqtSignal, QPoint, QTimer
-from PyQt5.QtGui import QPixmap, QPainter, QPen, QBrush, QColor, QFont, QMouseEvent
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QMessageBox, QInputDialog, QMenu, QAction, QDialog, QScrollArea, QPushButton, QApplication, QFormLayout, QLineEdit, QTextEdit
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QPoint, QPointF, QRect, QTimer, QRunnable, QThreadPool
+from PyQt5.QtGui import QPixmap, QPixmapCache, QImage, QImageReader, QPainter, QPen, QBrush, QColor, QFont, QMouseEvent, QPolygon, QStaticText
 from typing import List
 from .data_models import PlacedAP, ScanPoint
 # from .scan_simulator import ScanSimulator  # Removed for V1, will be used in V2 for predictive heatmaps
 from .wifi_scanner import WiFiScanner, WiFiScanError
 from .heatmap_generator import HeatmapGenerator
 
+# Debug output goes through logging; debug_mode lowers this logger to DEBUG
+_log = logging.getLogger(__name__)
+
+# Style sheet of the scan data dialogs' network lists (see _scan_data_view)
+_SCAN_DATA_CSS = """
+.scan-point { background-color: #f0f0f0; font-weight: bold; margin-top: 5px; }
+.network { margin: 4px 0 4px 10px; }
+.empty { font-style: italic; color: #666; margin: 20px; }
+"""
+
+# One network in the scan data dialogs, and the SSID shown for hidden networks
+_NETWORK_ROW_HTML = ('<p class="network">&bull; {ssid}<br>&nbsp;&nbsp;BSSID: {bssid}<br>'
+                     '&nbsp;&nbsp;RSSI: {rssi} dBm<br>&nbsp;&nbsp;Band: {band}</p>')
+_HIDDEN_SSID = "{Hidden}"
+
+
+class _HeatmapSignals(QObject):
+    """Signals of _HeatmapTask (QRunnable is not a QObject)"""
+    progress = pyqtSignal(int, object)  # percent, network name
+    finished = pyqtSignal(str, object)  # cache key, generate_heatmap_update result or None
+
+
+class _HeatmapTask(QRunnable):
+    """
+    Renders a signal heatmap on the global thread pool. Only QImages are
+    produced here; the GUI thread converts them to a QPixmap.
+    """
+
+    def __init__(self, generator, scan_points, target_network, floor, cache_key, previous=None):
+        """
+        Args:
+            generator: HeatmapGenerator used only by this task while it runs
+            scan_points: Snapshot of the floor's scan points
+            target_network: Network SSID, or None for strongest signal
+            floor: Floor the scan points belong to
+            cache_key: QPixmapCache key the result is stored under
+            previous: AP estimates the shown heatmap was rendered from; only
+                the region they changed in is rendered. None renders it all.
+        """
+        super().__init__()
+        self.signals = _HeatmapSignals()
+        self.generator = generator
+        self.scan_points = scan_points
+        self.target_network = target_network
+        self.floor = floor
+        self.cache_key = cache_key
+        self.previous = previous
+
+    def run(self):
+        result = None
+        try:
+            result = self.generator.generate_heatmap_update(
+                self.scan_points,
+                target_network=self.target_network,
+                floor=self.floor,
+                previous=self.previous,
+                status_callback=self.signals.progress.emit
+            )
+        except Exception:
+            _log.exception("Heatmap generation failed")
+        self.signals.finished.emit(self.cache_key, result)
+
+
+class _WifiScanSignals(QObject):
+    """Signals of _WifiScanTask"""
+    finished = pyqtSignal(object, object)  # scan request, list of APData
+    failed = pyqtSignal(object, object)  # scan request, exception
+
+
+class _WifiScanTask(QRunnable):
+    """
+    Runs a live WiFi scan off the GUI thread, which stays responsive for
+    the up to 30 seconds it takes. The scan point is added on the GUI thread.
+    """
+
+    def __init__(self, scanner, request):
+        """
+        Args:
+            scanner: WiFiScanner to scan with
+            request (dict): Where the scan was started ('floor', 'x', 'y' and
+                the 'ap' scanned at, or None); handed back with the result
+        """
+        super().__init__()
+        self.signals = _WifiScanSignals()
+        self.scanner = scanner
+        self.request = request
+
+    def run(self):
+        try:
+            ap_data_list = self.scanner.scan(timeout=30)
+        except Exception as e:
+            self.signals.failed.emit(self.request, e)
+        else:
+            self.signals.finished.emit(self.request, ap_data_list)
+
+
 class InteractiveMapView(QWidget):
     """
     Interactive map view widget for displaying floor plans and placing APs
@@ -46,17 +147,125 @@ class InteractiveMapView(QWidget):
         super().__init__(parent)
         self.i18n = i18n_manager
         self.debug_mode = debug_mode
+        if debug_mode:
+            _log.setLevel(logging.DEBUG)
 
         # Map data
         self.current_floor = None
-        self.base_pixmap = None  # Original floor plan image
-        self.display_pixmap = None  # Rendered image with APs
+        # Size of the original floor plan; map coordinates are pixels of it
+        self._plan_size = None
+        # Floor plan decoded at _base_scale of its size and pre-converted to a
+        # format QPainter and scaling are fastest on (RGB32 / ARGB32_Premultiplied);
+        # every render starts from a copy of it. _base_scale is the smallest of
+        # floor_plan_decode_scales covering the zoom, so a zoomed-out view of a
+        # large plan never keeps the full-resolution image in memory.
+        self._base_image = None
+        self._base_scale = None
+        self.floor_plan_decode_scales = (0.25, 0.5, 1.0)
+        self.display_image = None  # Rendered image with APs, at the current zoom
+
+        # Smoothly scaled copies of _base_image by (width, height), most recent last;
+        # markers are painted onto these directly so the composite is never rescaled
+        self._scaled_base_cache = {}
+        self.scaled_base_cache_size = 3
+
+        # Two render targets at the current zoom size, used in turn: the label's
+        # pixmap shares the pixels of the one on screen, so _render_map paints
+        # into the other instead of allocating a new image every time
+        self._render_buffers = [None, None]
+
+        # (key, QImage) of the floor plan with the heatmap overlays blended in,
+        # at the last rendered zoom and view; renders start from it and only
+        # add the markers while the plan and overlays are unchanged
+        self._overlay_layer = None
+
+        # How far (floor plan pixels) a marker and its label reach from its
+        # position; clipped repaints skip markers farther than this
+        self.marker_extent = 50
+
+        # Above viewport_render_zoom only the part of the map visible in the
+        # enclosing scroll area, plus viewport_render_margin pixels around it,
+        # is rendered. _view_rect is the part of the zoomed map display_image covers.
+        self.viewport_render_zoom = 1.0
+        self.viewport_render_margin = 256
+        self._view_rect = QRect()
+        # (x offset, y offset, width, height, shift x, shift y, scale x, scale y)
+        # of the shown pixmap, see _show_display_image
+        self._map_xform = None
+        self._scroll_area = None  # Found on first use, see _find_scroll_area
+        # Scrolling re-renders at most once per interval, and only once the
+        # visible part leaves _view_rect
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(16)
+        self._scroll_timer.timeout.connect(self._flush_scroll)
+
+        # Map rendered without the AP being dragged; each drag frame only adds that AP.
+        # Drag frames are painted into two [image, marker rect] buffers used in
+        # turn (see _render_buffers), each repainting just where its last marker was
+        self._static_composite = None
+        self._drag_frames = []
+
+        # Latest drag position not yet drawn; moves are coalesced into at
+        # most one drag frame per _drag_timer interval (~60 fps)
+        self._pending_drag_pos = None
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setSingleShot(True)
+        self._drag_timer.setInterval(16)
+        self._drag_timer.timeout.connect(self._flush_drag)
+
+        # k-d tree over the floor's scan point positions for hit-testing,
+        # rebuilt on first use after the scan points change
+        self._scan_kdtree = None
+
+        # _has_scan_data result per AP (by id), dropped with the hit-test positions
+        self._scanned_cache = {}
 
         # Heatmap functionality
         self.heatmap_generator = HeatmapGenerator()
         self.heatmap_enabled = False
         self.current_heatmap_network = None  # None means strongest signal
         self.heatmap_pixmap = None
+        # Set when scan points, target network or floor change; until then
+        # _update_heatmap keeps the current heatmap_pixmap
+        self._heatmap_dirty = True
+        # Bumped on every scan point change; part of the QPixmapCache key of
+        # each network's heatmap, so stale entries are never looked up again
+        self._scan_revision = 0
+        # Heatmaps are rendered off the GUI thread by _HeatmapTask, one at a time,
+        # with a generator of their own so the worker never shares state with
+        # this thread
+        self._heatmap_worker_generator = HeatmapGenerator()
+        self._heatmap_in_flight = False
+        # Python must not shut down while a worker thread still runs a scan or
+        # heatmap render (that crashes on exit), so wait for them when the app quits
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._wait_for_workers)
+        # (pixmap, (floor id, network, size), AP estimates) of the last rendered
+        # heatmap; while it is still shown for the same floor, network and size,
+        # updates only re-render the region the AP estimates changed in
+        self._heatmap_source = None
+        self._heatmap_base = None  # Pixmap the in-flight task's region is drawn onto
+        # Heatmap progress messages are shown at most once per interval (seconds);
+        # interference rendering reports once per coverage source
+        self.progress_interval = 0.05
+        self._last_progress_time = 0.0
+        # Scan data changes update the heatmap once they have settled for
+        # _heatmap_timer's interval, and re-render at most once per
+        # _render_timer interval, so bulk edits cost one update and one render
+        self._heatmap_timer = QTimer(self)
+        self._heatmap_timer.setSingleShot(True)
+        self._heatmap_timer.setInterval(50)
+        self._heatmap_timer.timeout.connect(self._flush_heatmap_update)
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(16)
+        self._render_timer.timeout.connect(self._render_map)
+
+        # Result of get_strongest_network_ssid, recomputed after scan point changes
+        self._strongest_ssid_cache = None
+        self._strongest_ssid_dirty = True
 
         # Interference heatmap support
         self.interference_heatmap_enabled = False
@@ -74,11 +283,19 @@ class InteractiveMapView(QWidget):
         self.min_zoom = 0.25   # 25% minimum zoom
         self.max_zoom = 4.0    # 400% maximum zoom
         self.zoom_step = 0.25  # 25% zoom increments
+        self._displayed_zoom = None  # Zoom level of the last full render
 
 
         # WiFi Scanner for live scanning only
         self.wifi_scanner = WiFiScanner()
         self.use_live_scanning = self.wifi_scanner.is_available()
+        # Scans run in the background one at a time (the adapter can only do
+        # one); further scans queue up and complete in the order requested
+        self._scan_pool = QThreadPool(self)
+        self._scan_pool.setMaxThreadCount(1)
+        # One message box for all scan failures (see _show_scan_error)
+        self._scan_error_box = QMessageBox(self)
+        self._scan_error_box.setStandardButtons(QMessageBox.Ok)
 
         self._init_ui()
 
@@ -100,6 +317,59 @@ class InteractiveMapView(QWidget):
         # Set the widget size to match the label size
         self.setMinimumSize(800, 600)
 
+        # Marker glyphs rendered once and blitted per AP / scan point
+        self._ap_sprite_scanned = self._create_marker_sprite(
+            24, QPen(QColor(0, 100, 200), 2), QBrush(QColor(100, 150, 255, 180)), antenna=True)
+        self._ap_sprite_unscanned = self._create_marker_sprite(
+            24, QPen(QColor(200, 100, 0), 2), QBrush(QColor(255, 180, 100, 180)), antenna=True)
+        self._scan_point_sprite = self._create_marker_sprite(
+            12, QPen(QColor(0, 150, 0), 2), QBrush(QColor(0, 200, 0, 150)))
+
+        # Painter state for marker labels, set once per render pass
+        self._marker_font = QFont("Arial", 10, QFont.Bold)
+        self._label_pen = QPen(QColor(0, 0, 0))
+
+        # Below simple_scan_points_zoom scan points are drawn as plain dots in
+        # one drawPoints call, without their border and number
+        self.simple_scan_points_zoom = 1.0
+        self._scan_point_dot_pen = QPen(QColor(0, 150, 0), 12, Qt.SolidLine, Qt.RoundCap)
+
+        # Laid-out scan point numbers and the font they were laid out in
+        self._scan_number_texts = []
+        self._scan_number_font = None
+
+    def _create_marker_sprite(self, diameter, pen, brush, antenna=False):
+        """
+        Render a circular map marker into a transparent pixmap.
+
+        The pixmap has a 1-pixel margin for the pen, so a marker centered on
+        (x, y) is drawn at (x - diameter // 2 - 1, y - diameter // 2 - 1).
+
+        Args:
+            diameter (int): Circle diameter in pixels
+            pen (QPen): Circle outline
+            brush (QBrush): Circle fill
+            antenna (bool): Draw the AP antenna cross inside the circle
+
+        Returns:
+            QPixmap: The marker sprite
+        """
+        sprite = QPixmap(diameter + 2, diameter + 2)
+        sprite.fill(Qt.transparent)
+
+        painter = QPainter(sprite)
+        painter.setPen(pen)
+        painter.setBrush(brush)
+        painter.drawEllipse(1, 1, diameter, diameter)
+        if antenna:
+            center = diameter // 2 + 1
+            painter.setPen(QPen(QColor(0, 0, 0), 2))
+            painter.drawLine(center - 8, center - 8, center + 8, center + 8)
+            painter.drawLine(center - 8, center + 8, center + 8, center - 8)
+        painter.end()
+
+        return sprite
+
     def set_floor(self, floor):
         """
         Set the current floor to display
@@ -108,6 +378,8 @@ class InteractiveMapView(QWidget):
             floor (Floor): Floor object to display
         """
         self.current_floor = floor
+        self._scan_points_changed()
+        self.heatmap_pixmap = None  # Don't show the previous floor's heatmap while rendering
         self._load_floor_image()
 
         # Floor data updated - ready for live WiFi scanning
@@ -117,40 +389,252 @@ class InteractiveMapView(QWidget):
 
     def _load_floor_image(self):
         """Load the floor plan image"""
+        self._plan_size = None
+        self._base_image = None
+        self._base_scale = None
+        self._scaled_base_cache = {}
+        self._render_buffers = [None, None]
+        self._overlay_layer = None
         if not self.current_floor or not self.current_floor.scaled_image_path:
-            self.base_pixmap = None
+            self._map_xform = None
             self.map_label.setText("No floor plan loaded")
             return
 
-        self.base_pixmap = QPixmap(self.current_floor.scaled_image_path)
-        if self.base_pixmap.isNull():
-            self.base_pixmap = None
+        # Only the header is read here; formats that don't store their size
+        # in it are decoded at full size
+        plan_size = QImageReader(self.current_floor.scaled_image_path).size()
+        scale = self._decode_scale(self.zoom_level) if plan_size.isValid() else 1.0
+        base_image = self._decode_floor_plan(scale)
+        if base_image.isNull():
+            self._map_xform = None
             self.map_label.setText(f"Error loading floor plan: {self.current_floor.scaled_image_path}")
-            if self.debug_mode:
-                print(f"DEBUG: Failed to load image: {self.current_floor.scaled_image_path}")
+            _log.debug("Failed to load image: %s", self.current_floor.scaled_image_path)
+        else:
+            self._plan_size = plan_size if plan_size.isValid() else base_image.size()
+            self._base_image = base_image
+            self._base_scale = scale
+            _log.debug("Loaded floor plan: %s", self.current_floor.scaled_image_path)
+
+    def _decode_scale(self, zoom):
+        """
+        Get the resolution the floor plan needs to be decoded at for a zoom level.
+
+        Args:
+            zoom (float): Zoom level
+
+        Returns:
+            float: The smallest of floor_plan_decode_scales covering the zoom (at most 1.0)
+        """
+        for scale in self.floor_plan_decode_scales:
+            if scale >= min(zoom, 1.0):
+                return scale
+        return 1.0
+
+    def _decode_floor_plan(self, scale):
+        """
+        Decode the floor plan at a fraction of its size.
+
+        Args:
+            scale (float): Fraction of the plan's width and height, at most 1.0
+
+        Returns:
+            QImage: The plan as RGB32 / ARGB32_Premultiplied, or a null image on failure
+        """
+        reader = QImageReader(self.current_floor.scaled_image_path)
+        if scale < 1.0:
+            # Decoders that support it (e.g. JPEG) skip the detail outright
+            reader.setScaledSize(reader.size() * scale)
+        image = reader.read()
+        if image.isNull():
+            return image
+
+        if scale < 1.0:
+            # Some decoders scale the resolution (DPI) along with the pixels; text
+            # on the map is sized from it, so take it from a 1x1 unscaled read
+            probe = QImageReader(self.current_floor.scaled_image_path)
+            probe.setClipRect(QRect(0, 0, 1, 1))
+            header = probe.read()
+            if not header.isNull():
+                image.setDotsPerMeterX(header.dotsPerMeterX())
+                image.setDotsPerMeterY(header.dotsPerMeterY())
+
+        # Opaque plans stay RGB32; plans with transparency go premultiplied
+        image_format = (QImage.Format_ARGB32_Premultiplied if image.hasAlphaChannel()
+                        else QImage.Format_RGB32)
+        return image.convertToFormat(image_format)
+
+    def _set_base_scale(self, zoom):
+        """
+        Re-decode the floor plan when a zoom level crosses into another
+        resolution band: from the file going up, from the decoded image going down.
+
+        Args:
+            zoom (float): Zoom level about to be rendered
+        """
+        scale = self._decode_scale(zoom)
+        if scale == self._base_scale:
+            return
+
+        if scale > self._base_scale:
+            base_image = self._decode_floor_plan(scale)
+            if base_image.isNull():
+                return  # Keep drawing the lower resolution plan
         else:
-            if self.debug_mode:
-                print(f"DEBUG: Loaded floor plan: {self.current_floor.scaled_image_path}")
+            base_image = self._base_image.scaled(self._plan_size * scale, Qt.IgnoreAspectRatio,
+                                                 Qt.SmoothTransformation)
+        _log.debug("Floor plan decoded at %s%%", int(scale * 100))
+        self._base_image = base_image
+        self._base_scale = scale
+        self._scaled_base_cache = {}
+
+    @property
+    def display_pixmap(self):
+        """The rendered map (floor plan, overlays and markers) at 100% as a QPixmap, or None"""
+        if self.display_image is None:
+            return None
+        # Already rendered at 100% if the whole map is shown at the plan's size
+        full_size = self._plan_size
+        if self._view_rect.size() == full_size and full_size * self.zoom_level == full_size:
+            return QPixmap.fromImage(self.display_image)
+        full_size_image = self._compose_map(zoom=1.0)
+        return QPixmap.fromImage(full_size_image) if full_size_image is not None else None
 
     def _render_map(self):
         """Render the map with placed APs and scan points"""
-        if not self.base_pixmap:
+        if self._base_image is None:
             return
 
-        # Create a copy of the base image to draw on
-        self.display_pixmap = self.base_pixmap.copy()
+        # Size the widget first: the scroll area positions it, which decides
+        # what part of the map is visible
+        zoom_size = self._plan_size * self.zoom_level
+        self.setFixedSize(zoom_size)
+        view_rect = self._render_rect(zoom_size)
 
-        # Ensure the pixmap is valid before painting
-        if self.display_pixmap.isNull():
+        display_image = self._compose_map(target=self._render_buffers[0], view_rect=view_rect)
+        if display_image is None:
             return
+        self._render_buffers = [self._render_buffers[1], display_image]
+        self.display_image = display_image
+        self._view_rect = view_rect
+        self._displayed_zoom = self.zoom_level
+        self._show_display_image()
+
+    def _render_region(self, map_rect):
+        """
+        Repaint only the part of the shown map around map_rect, e.g. where a
+        scan point was added, instead of composing the whole view again.
+        Falls back to a full render when the shown frame is not current.
 
-        painter = QPainter(self.display_pixmap)
+        Args:
+            map_rect (QRect): Changed area in floor plan coordinates, markers included
+        """
+        if (self.display_image is None or self._base_image is None or self.dragging_ap is not None
+                or self._render_timer.isActive() or self._displayed_zoom != self.zoom_level):
+            self._schedule_render()
+            return
+        visible_rect = self._visible_map_rect()
+        if visible_rect is not None and not self._view_rect.contains(visible_rect):
+            self._schedule_render()
+            return
+
+        # Changed area in display_image pixels, widened for smooth resampling
+        zoom = self.zoom_level
+        clip = QRect(int(map_rect.x() * zoom) - 2, int(map_rect.y() * zoom) - 2,
+                     int(map_rect.width() * zoom) + 4, int(map_rect.height() * zoom) + 4)
+        clip = clip.translated(-self._view_rect.topLeft()).intersected(self.display_image.rect())
+        if clip.isEmpty():
+            return
+
+        # Paint over the frame on screen (it detaches from the label's pixmap)
+        layer = self._overlay_layer
+        display_image = self._compose_map(target=self.display_image, view_rect=self._view_rect, clip=clip)
+        if display_image is not self.display_image:
+            self._render_map()
+            return
+        if self._overlay_layer is not layer and (self.heatmap_enabled or self.interference_heatmap_enabled):
+            # The overlays changed outside the clip too
+            self._render_map()
+            return
+        self._show_display_image()
+
+    def _compose_map(self, exclude_ap=None, zoom=None, target=None, view_rect=None, markers=True, clip=None):
+        """
+        Paint the heatmap overlays, APs and scan points onto a copy of the floor plan.
+
+        The floor plan is scaled first (and cached per size), then everything
+        else is painted in zoomed coordinates, so only the plan is ever resampled.
+        When only part of the map is rendered, the plan is resampled while
+        painting instead, so the whole zoomed plan is never built.
+
+        Args:
+            exclude_ap (PlacedAP, optional): AP to leave out (the one being dragged)
+            zoom (float, optional): Zoom level, defaults to the current one
+            target (QImage, optional): Image to paint into when it matches the
+                rendered size and format; a new image otherwise
+            view_rect (QRect, optional): Part of the zoomed map to render,
+                defaults to all of it
+            markers (bool): Draw APs and scan points; without them only the
+                plan and heatmap overlays are painted
+            clip (QRect, optional): Repaint only this part of target, which
+                must then hold the previous frame of the same view
+
+        Returns:
+            QImage: The composited map, or None if it could not be painted
+        """
+        if zoom is None:
+            zoom = self.zoom_level
+        self._set_base_scale(zoom)
+        zoom_size = self._plan_size * zoom
+        if view_rect is None:
+            view_rect = QRect(QPoint(0, 0), zoom_size)
+        partial = view_rect.size() != zoom_size
+
+        # With a heatmap shown, start from the cached plan-plus-overlays layer
+        if markers and (self.heatmap_enabled or self.interference_heatmap_enabled):
+            layer = self._get_overlay_layer(zoom, view_rect)
+            if layer is not None:
+                return self._compose_markers(layer, exclude_ap, zoom_size, view_rect, target, clip)
+
+        # Paint over the target if it fits, otherwise on a copy of the (zoomed) base image
+        if partial:
+            base_image = self._base_image
+            reuse_target = (target is not None and target.size() == view_rect.size()
+                            and target.format() == base_image.format())
+            display_image = target if reuse_target else QImage(view_rect.size(), base_image.format())
+        else:
+            base_image = self._scaled_base_image(zoom_size)
+            reuse_target = (target is not None and target.size() == base_image.size()
+                            and target.format() == base_image.format())
+            display_image = target if reuse_target else base_image.copy()
+
+        # Ensure the image is valid before painting
+        if display_image.isNull():
+            return None
+
+        painter = QPainter(display_image)
 
         # Check if painter is valid
         if not painter.isActive():
-            return
+            return None
+        if clip is not None:
+            painter.setClipRect(clip)
 
         try:
+            if partial:
+                # Resample just the visible part of the plan, overwriting the previous frame
+                self._set_map_transform(painter, zoom_size, view_rect.topLeft())
+                painter.setCompositionMode(QPainter.CompositionMode_Source)
+                painter.drawImage(QRect(QPoint(0, 0), self._plan_size), base_image)
+                painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+            else:
+                if reuse_target:
+                    # Overwrite the previous frame with the floor plan
+                    painter.setCompositionMode(QPainter.CompositionMode_Source)
+                    painter.drawImage(0, 0, base_image)
+                    painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+
+                self._set_map_transform(painter, zoom_size)
+
             # Draw heatmap overlay if enabled
             if self.heatmap_enabled:
                 self._draw_heatmap_overlay(painter)
@@ -159,83 +643,420 @@ class InteractiveMapView(QWidget):
             if self.interference_heatmap_enabled:
                 self._draw_interference_heatmap_overlay(painter)
 
-            # Draw placed APs
-            self._draw_placed_aps(painter)
+            if markers:
+                area = self._paint_area(painter, clip, display_image)
+
+                # Draw placed APs
+                self._draw_placed_aps(painter, exclude_ap, area)
 
-            # Draw scan points
-            self._draw_scan_points(painter)
+                # Draw scan points
+                self._draw_scan_points(painter, area)
         finally:
             # Ensure painter is always properly ended
             if painter.isActive():
                 painter.end()
 
-        # Scale to actual zoom level, not to fit label
-        original_size = self.base_pixmap.size()
-        zoom_size = original_size * self.zoom_level
-        scaled_pixmap = self.display_pixmap.scaled(
-            zoom_size,
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        return display_image
 
-        # Resize widget and label to match zoom
-        self.map_label.setFixedSize(zoom_size)
-        self.setFixedSize(zoom_size)
+    def _get_overlay_layer(self, zoom, view_rect):
+        """
+        Get the floor plan with the enabled heatmap overlays blended in,
+        repainting it only when the plan, an overlay, the zoom or the view changed.
+
+        Args:
+            zoom (float): Zoom level
+            view_rect (QRect): Part of the zoomed map rendered
+
+        Returns:
+            QImage: The layer, or None if it could not be painted
+        """
+        def overlay_key(enabled, pixmap):
+            return pixmap.cacheKey() if enabled and pixmap is not None else None
+
+        key = (zoom, view_rect.getRect(), self._base_image.cacheKey(),
+               bool(self.current_floor and self.current_floor.scan_points),
+               overlay_key(self.heatmap_enabled, self.heatmap_pixmap),
+               overlay_key(self.interference_heatmap_enabled, self.interference_heatmap_pixmap))
+        if self._overlay_layer is not None and self._overlay_layer[0] == key:
+            return self._overlay_layer[1]
+
+        previous = self._overlay_layer[1] if self._overlay_layer is not None else None
+        layer = self._compose_map(zoom=zoom, target=previous, view_rect=view_rect, markers=False)
+        # Drawing the overlays may have replaced a heatmap pixmap (e.g. from the
+        # cache); key the layer by what it was actually painted with
+        key = key[:4] + (overlay_key(self.heatmap_enabled, self.heatmap_pixmap),
+                         overlay_key(self.interference_heatmap_enabled, self.interference_heatmap_pixmap))
+        self._overlay_layer = (key, layer) if layer is not None else None
+        return layer
+
+    def _compose_markers(self, layer, exclude_ap, zoom_size, view_rect, target, clip=None):
+        """
+        Paint APs and scan points onto a copy of the overlay layer.
+
+        Args:
+            layer (QImage): Plan with heatmap overlays (see _get_overlay_layer)
+            exclude_ap (PlacedAP, optional): AP to leave out
+            zoom_size (QSize): Size of the whole zoomed map
+            view_rect (QRect): Part of the zoomed map the layer covers
+            target (QImage, optional): Image to paint into when it matches the layer
+            clip (QRect, optional): Repaint only this part of target
+
+        Returns:
+            QImage: The composited map, or None if it could not be painted
+        """
+        reuse_target = (target is not None and target is not layer and target.size() == layer.size()
+                        and target.format() == layer.format())
+        display_image = target if reuse_target else layer.copy()
+        if display_image.isNull():
+            return None
+
+        painter = QPainter(display_image)
+        if not painter.isActive():
+            return None
+        if clip is not None:
+            painter.setClipRect(clip)
+        try:
+            if reuse_target:
+                # Overwrite the previous frame with the layer
+                painter.setCompositionMode(QPainter.CompositionMode_Source)
+                painter.drawImage(0, 0, layer)
+                painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+            self._set_map_transform(painter, zoom_size, view_rect.topLeft())
+            area = self._paint_area(painter, clip, display_image)
+            self._draw_placed_aps(painter, exclude_ap, area)
+            self._draw_scan_points(painter, area)
+        finally:
+            if painter.isActive():
+                painter.end()
+
+        return display_image
+
+    def _render_drag_frame(self):
+        """Render a drag frame: the static composite plus the AP being dragged"""
+        if len(self._drag_frames) < 2:
+            frame = [self._static_composite.copy(), None]
+        else:
+            # The older buffer is no longer on screen
+            frame = self._drag_frames.pop(0)
+        self._drag_frames.append(frame)
+        display_image, dirty_rect = frame
 
-        self.map_label.setPixmap(scaled_pixmap)
+        painter = QPainter(display_image)
+        if not painter.isActive():
+            return
+        try:
+            # Put back the static composite where this buffer's last marker was
+            if dirty_rect is not None:
+                painter.setCompositionMode(QPainter.CompositionMode_Source)
+                painter.drawImage(dirty_rect, self._static_composite, dirty_rect)
+                painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+
+            self._set_map_transform(painter, self._plan_size * self.zoom_level,
+                                    self._view_rect.topLeft())
+            extent = self.marker_extent
+            marker_rect = QRect(int(self.dragging_ap.map_x) - extent, int(self.dragging_ap.map_y) - extent,
+                                2 * extent, 2 * extent)
+            # Widened for smooth resampling, as in _render_region
+            transform = painter.transform()
+            frame[1] = transform.mapRect(marker_rect).adjusted(-2, -2, 2, 2)
+            # Clip in image pixels, then restore the map transform
+            painter.resetTransform()
+            painter.setClipRect(frame[1])
+            painter.setTransform(transform)
+            painter.setFont(self._marker_font)
+            painter.setPen(self._label_pen)
+            # The dragged AP may have moved onto or off a scan point
+            self._scanned_cache.pop(id(self.dragging_ap), None)
+            self._draw_ap_marker(painter, self.dragging_ap)
+        finally:
+            if painter.isActive():
+                painter.end()
+
+        self.display_image = display_image
+        self._show_display_image()
+
+    def _show_display_image(self):
+        """Show display_image in the map label, over the part of the map it covers"""
+        # The widget spans the whole zoomed map, so the scroll area's range
+        # stays right; the label only covers the rendered part
+        self.setFixedSize(self._plan_size * self.zoom_level)
+        self.map_label.setFixedSize(self.display_image.size())
+        self.map_label.move(self._view_rect.topLeft())
+
+        self.map_label.setPixmap(QPixmap.fromImage(self.display_image))
         self.map_label.setText("")  # Clear any text
 
-    def _draw_placed_aps(self, painter):
-        """Draw AP markers on the map"""
-        if not self.current_floor or not self.current_floor.placed_aps:
+        # Label-to-map transform for _label_to_map_coords, which runs on every
+        # mouse move: the pixmap is centered in the label and shows the zoomed
+        # map from _view_rect's corner
+        label_size = self.map_label.size()
+        width, height = self.display_image.width(), self.display_image.height()
+        x_offset = (label_size.width() - width) // 2
+        y_offset = (label_size.height() - height) // 2
+        zoom_size = self._plan_size * self.zoom_level
+        self._map_xform = (x_offset, y_offset, width, height,
+                           self._view_rect.x() - x_offset, self._view_rect.y() - y_offset,
+                           self._plan_size.width() / zoom_size.width(),
+                           self._plan_size.height() / zoom_size.height())
+
+    def _render_rect(self, zoom_size):
+        """
+        Part of the zoomed map to render.
+
+        Args:
+            zoom_size (QSize): Size of the whole map at the current zoom
+
+        Returns:
+            QRect: The whole map, or above viewport_render_zoom the part
+            visible in the scroll area plus a margin
+        """
+        full_rect = QRect(QPoint(0, 0), zoom_size)
+        if self.zoom_level <= self.viewport_render_zoom:
+            return full_rect
+
+        visible_rect = self._visible_map_rect()
+        if visible_rect is None:
+            return full_rect
+
+        margin = self.viewport_render_margin
+        return visible_rect.adjusted(-margin, -margin, margin, margin).intersected(full_rect)
+
+    def _visible_map_rect(self):
+        """
+        Part of the zoomed map visible in the enclosing scroll area.
+
+        Returns:
+            QRect in zoomed map coordinates, or None outside a scroll area
+        """
+        scroll_area = self._find_scroll_area()
+        if scroll_area is None:
+            return None
+
+        # The scroll area moves this widget to (-scroll x, -scroll y) in its viewport
+        viewport = scroll_area.viewport()
+        return QRect(-self.x(), -self.y(), viewport.width(), viewport.height()).intersected(self.rect())
+
+    def _find_scroll_area(self):
+        """
+        Find the QScrollArea this widget is shown in and follow its scrolling.
+
+        Returns:
+            QScrollArea, or None if there is none (yet)
+        """
+        if self._scroll_area is None:
+            parent = self.parent()
+            while parent is not None and not isinstance(parent, QScrollArea):
+                parent = parent.parent()
+            if parent is None:
+                return None
+
+            self._scroll_area = parent
+            for scroll_bar in (parent.horizontalScrollBar(), parent.verticalScrollBar()):
+                scroll_bar.valueChanged.connect(self._on_viewport_scrolled)
+                scroll_bar.rangeChanged.connect(self._on_viewport_scrolled)
+        return self._scroll_area
+
+    def _on_viewport_scrolled(self, *args):
+        """Scroll position or range changed; check the rendered part on the next timer tick"""
+        if not self._scroll_timer.isActive():
+            self._scroll_timer.start()
+
+    def _flush_scroll(self):
+        """Re-render once the visible part of the map is no longer covered by display_image"""
+        if (self.display_image is None or self.dragging_ap is not None
+                or self.zoom_level <= self.viewport_render_zoom):
             return
 
-        painter.setFont(QFont("Arial", 10, QFont.Bold))
+        visible_rect = self._visible_map_rect()
+        if visible_rect is not None and not self._view_rect.contains(visible_rect):
+            self._render_map()
 
-        for ap in self.current_floor.placed_aps:
-            x, y = int(ap.map_x), int(ap.map_y)
+    def _scaled_base_image(self, size):
+        """
+        Get the floor plan smoothly scaled to the given size.
 
-            # Choose colors based on whether AP has scan data
-            if self._has_scan_data(ap):
-                # AP with scan data - solid blue
-                pen_color = QColor(0, 100, 200)
-                brush_color = QColor(100, 150, 255, 180)
-            else:
-                # AP without scan data - orange/yellow to indicate needs scanning
-                pen_color = QColor(200, 100, 0)
-                brush_color = QColor(255, 180, 100, 180)
+        Args:
+            size (QSize): Target size
 
-            # Draw AP marker (circle with antenna symbol)
-            painter.setPen(QPen(pen_color, 2))
-            painter.setBrush(QBrush(brush_color))
-            painter.drawEllipse(x - 12, y - 12, 24, 24)
+        Returns:
+            QImage: The scaled floor plan (the original at 100%)
+        """
+        if size == self._base_image.size():
+            return self._base_image
+
+        key = (size.width(), size.height())
+        scaled = self._scaled_base_cache.pop(key, None)
+        if scaled is None:
+            scaled = self._base_image.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            if len(self._scaled_base_cache) >= self.scaled_base_cache_size:
+                del self._scaled_base_cache[next(iter(self._scaled_base_cache))]
+        self._scaled_base_cache[key] = scaled
+        return scaled
+
+    def _set_map_transform(self, painter, zoom_size, origin=None):
+        """
+        Map floor plan coordinates onto a zoomed map image.
 
-            # Draw antenna lines
-            painter.setPen(QPen(QColor(0, 0, 0), 2))
-            painter.drawLine(x - 8, y - 8, x + 8, y + 8)
-            painter.drawLine(x - 8, y + 8, x + 8, y - 8)
+        Args:
+            painter (QPainter): Active painter on the image
+            zoom_size (QSize): Size of the whole map at the zoom level
+            origin (QPoint, optional): Position of the image's top-left corner
+                in the zoomed map, when it covers only part of it
+        """
+        if origin is not None:
+            painter.translate(-origin.x(), -origin.y())
+        if zoom_size != self._plan_size:
+            painter.scale(zoom_size.width() / self._plan_size.width(),
+                          zoom_size.height() / self._plan_size.height())
+            # Resample overlays and marker sprites bilinearly, as the
+            # smooth scaling of the whole composite used to
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+
+    def _paint_area(self, painter, clip, image):
+        """
+        Floor plan area a repaint covers, so markers outside the rendered
+        viewport (or the clip of a partial repaint) can be skipped.
+
+        Args:
+            painter (QPainter): Painter with the map transform set
+            clip (QRect): Clip rectangle in image pixels, or None
+            image (QImage): Image being painted
+
+        Returns:
+            QRect: Area in floor plan coordinates
+        """
+        return painter.transform().inverted()[0].mapRect(clip if clip is not None else image.rect())
 
-            # Draw AP name
-            painter.setPen(QPen(QColor(0, 0, 0)))
-            painter.drawText(x - 30, y + 25, 60, 15, Qt.AlignCenter, ap.name)
+    def _indices_in(self, positions, area):
+        """
+        Indices of the markers that may reach into an area.
 
-    def _draw_scan_points(self, painter):
-        """Draw scan point markers on the map"""
+        Args:
+            positions (np.ndarray): (N, 2) marker positions in floor plan coordinates
+            area (QRect): Area in floor plan coordinates
+
+        Returns:
+            np.ndarray: Indices of the positions within marker_extent of area
+        """
+        extent = self.marker_extent
+        x, y = positions[:, 0], positions[:, 1]
+        return np.flatnonzero((x >= area.left() - extent) & (x <= area.right() + extent)
+                              & (y >= area.top() - extent) & (y <= area.bottom() + extent))
+
+    def _draw_placed_aps(self, painter, exclude_ap=None, area=None):
+        """
+        Draw AP markers on the map, optionally leaving one AP out
+
+        Args:
+            painter (QPainter): Painter with the map transform set
+            exclude_ap (PlacedAP, optional): AP to leave out (the one being dragged)
+            area (QRect, optional): Only draw the markers reaching into this
+                floor plan area (the rendered viewport or repaint clip)
+        """
+        if not self.current_floor or not self.current_floor.placed_aps:
+            return
+
+        painter.setFont(self._marker_font)
+        painter.setPen(self._label_pen)
+
+        placed_aps = self.current_floor.placed_aps
+        if area is not None:
+            placed_aps = [placed_aps[i] for i in self._indices_in(self.current_floor.placed_ap_positions(), area)]
+
+        # Split by marker sprite once, so each loop below only blits
+        aps = [ap for ap in placed_aps if ap is not exclude_ap]
+        self._update_scanned_cache(aps)
+        scanned, unscanned = [], []
+        for ap in aps:
+            (scanned if self._has_scan_data(ap) else unscanned).append(ap)
+
+        # Blue markers for APs with scan data, orange for APs still to scan
+        for sprite, group in ((self._ap_sprite_scanned, scanned), (self._ap_sprite_unscanned, unscanned)):
+            for ap in group:
+                painter.drawPixmap(int(ap.map_x) - 13, int(ap.map_y) - 13, sprite)
+
+        # AP names on top of all markers
+        for ap in aps:
+            painter.drawText(int(ap.map_x) - 30, int(ap.map_y) + 25, 60, 15, Qt.AlignCenter, ap.name)
+
+    def _draw_ap_marker(self, painter, ap):
+        """Draw a single AP marker and its name (label font and pen already set)"""
+        x, y = int(ap.map_x), int(ap.map_y)
+
+        # Draw AP marker (circle with antenna symbol): blue with scan data,
+        # orange/yellow to indicate the AP still needs scanning
+        if self._has_scan_data(ap):
+            sprite = self._ap_sprite_scanned
+        else:
+            sprite = self._ap_sprite_unscanned
+        painter.drawPixmap(x - 13, y - 13, sprite)
+
+        # Draw AP name
+        painter.drawText(x - 30, y + 25, 60, 15, Qt.AlignCenter, ap.name)
+
+    def _draw_scan_points(self, painter, area=None):
+        """
+        Draw scan point markers on the map
+
+        Args:
+            painter (QPainter): Painter with the map transform set
+            area (QRect, optional): Only draw the markers reaching into this
+                floor plan area (the rendered viewport or repaint clip)
+        """
         if not self.current_floor or not self.current_floor.scan_points:
             return
 
-        for i, scan_point in enumerate(self.current_floor.scan_points):
+        scan_points = self.current_floor.scan_points
+        if area is not None:
+            indices = self._indices_in(self.current_floor.scan_point_positions(), area).tolist()
+        else:
+            indices = range(len(scan_points))
+
+        if self.zoom_level < self.simple_scan_points_zoom:
+            # Zoomed out: all markers as round dots in a single call
+            painter.setPen(self._scan_point_dot_pen)
+            painter.setRenderHint(QPainter.Antialiasing, True)  # Round, not blocky, at a few pixels
+            painter.drawPoints(QPolygon([QPoint(int(scan_points[i].map_x), int(scan_points[i].map_y))
+                                         for i in indices]))
+            painter.setRenderHint(QPainter.Antialiasing, False)
+            return
+
+        painter.setPen(self._label_pen)
+        scan_number_texts = self._get_scan_number_texts(len(scan_points), painter.font())
+
+        for i in indices:
+            scan_point = scan_points[i]
             x, y = int(scan_point.map_x), int(scan_point.map_y)
 
             # Draw scan point marker (small green circle)
-            painter.setPen(QPen(QColor(0, 150, 0), 2))
-            painter.setBrush(QBrush(QColor(0, 200, 0, 150)))
-            painter.drawEllipse(x - 6, y - 6, 12, 12)
+            painter.drawPixmap(x - 7, y - 7, self._scan_point_sprite)
+
+            # Draw sequential scan point number (1-based), centered below the marker
+            text, half_width, half_height = scan_number_texts[i]
+            painter.drawStaticText(QPointF(x - half_width, y + 25 - half_height), text)
+
+    def _get_scan_number_texts(self, count, font):
+        """
+        Get laid-out labels for scan point numbers 1..count.
 
-            # Draw sequential scan point number (1-based)
-            scan_number = i + 1
-            painter.setPen(QPen(QColor(0, 0, 0)))
-            painter.drawText(x - 10, y + 20, 20, 10, Qt.AlignCenter, str(scan_number))
+        Args:
+            count (int): Number of scan points
+            font (QFont): Font the labels are drawn with
+
+        Returns:
+            list: (QStaticText, half width, half height) per scan point
+        """
+        texts = self._scan_number_texts
+        if self._scan_number_font != font:
+            texts.clear()
+            self._scan_number_font = QFont(font)
+
+        for scan_number in range(len(texts) + 1, count + 1):
+            text = QStaticText(str(scan_number))
+            text.prepare(font=font)
+            size = text.size()
+            texts.append((text, size.width() / 2, size.height() / 2))
+        return texts
 
     def _draw_heatmap_overlay(self, painter):
         """Draw heatmap overlay on the map"""
@@ -252,44 +1073,152 @@ class InteractiveMapView(QWidget):
             painter.drawPixmap(0, 0, self.heatmap_pixmap)
             painter.setOpacity(1.0)  # Reset opacity
 
+    def _schedule_render(self):
+        """Re-render the map on the next _render_timer tick"""
+        if not self._render_timer.isActive():
+            self._render_timer.start()
+
+    def _schedule_heatmap_update(self):
+        """Update the heatmap once scan data changes have settled, if it is shown"""
+        if self.heatmap_enabled:
+            # Restarting pushes the update back until changes stop coming
+            self._heatmap_timer.start()
+
+    def _clear_heatmap(self):
+        """Drop the heatmap right away after all scan points were removed"""
+        # An update would only find the scan points empty
+        self._heatmap_timer.stop()
+        self.heatmap_pixmap = None
+        self._heatmap_source = None
+
+    def _flush_heatmap_update(self):
+        """Update the heatmap after scan data changes (_heatmap_timer)"""
+        if self.heatmap_enabled:
+            self._update_heatmap()
+            # Show a cleared or cached heatmap; new ones redraw when they arrive
+            self._schedule_render()
+
     def _update_heatmap(self):
         """Update the heatmap based on current scan data"""
         if not self.current_floor or not self.current_floor.scan_points:
             self.heatmap_pixmap = None
             return
 
+        # Nothing changed since the last generation
+        if not self._heatmap_dirty and self.heatmap_pixmap:
+            return
+
         # Set heatmap dimensions to match floor plan
-        if self.base_pixmap:
-            width, height = self.base_pixmap.width(), self.base_pixmap.height()
+        if self._plan_size is not None:
+            width, height = self._plan_size.width(), self._plan_size.height()
             self.heatmap_generator.width = width
             self.heatmap_generator.height = height
 
-        # Generate heatmap with progress indication
-        # Show status for heatmap generation
+        # Reuse this network's heatmap if it was generated for the same scan data
+        cache_key = self._heatmap_cache_key()
+        cached_pixmap = QPixmapCache.find(cache_key)
+        if cached_pixmap is not None and not cached_pixmap.isNull():
+            self.heatmap_pixmap = cached_pixmap
+            self._heatmap_dirty = False
+            return
+
+        # Already rendering; _on_heatmap_finished starts over if the result is stale
+        if self._heatmap_in_flight:
+            return
+
+        # Render in the background; the map is redrawn when the result arrives
         self._update_status("Generating signal strength heatmap...")
+        generator = self._heatmap_worker_generator
+        generator.width = self.heatmap_generator.width
+        generator.height = self.heatmap_generator.height
+
+        # Patch the shown heatmap if it is this floor's and network's
+        source_key = (id(self.current_floor), self.current_heatmap_network, generator.width, generator.height)
+        previous = None
+        self._heatmap_base = None
+        if self._heatmap_source is not None:
+            pixmap, key, locations = self._heatmap_source
+            if pixmap is self.heatmap_pixmap and key == source_key:
+                previous = locations
+                self._heatmap_base = pixmap
+
+        task = _HeatmapTask(generator, list(self.current_floor.scan_points),
+                            self.current_heatmap_network, self.current_floor, cache_key, previous)
+        task.signals.progress.connect(self._heatmap_progress_callback)
+        task.signals.finished.connect(self._on_heatmap_finished)
+        self._heatmap_in_flight = True
+        QThreadPool.globalInstance().start(task)
+
+    def _on_heatmap_finished(self, cache_key, result):
+        """
+        Take over a heatmap rendered by _HeatmapTask (runs on the GUI thread).
 
-        # Force UI update to show status message immediately
-        QApplication.processEvents()
+        Args:
+            cache_key: QPixmapCache key the task was started for
+            result: (image, rect, AP estimates) from generate_heatmap_update,
+                or None when rendering failed
+        """
+        self._heatmap_in_flight = False
 
-        # Let the "Generating heatmap..." message show for 1 second
-        import time
-        time.sleep(1.0)
+        # Scan points, network or floor changed while rendering: start over
+        if cache_key != self._heatmap_cache_key():
+            if self.heatmap_enabled:
+                self._update_heatmap()
+            return
 
-        self.heatmap_pixmap = self.heatmap_generator.generate_heatmap(
-            self.current_floor.scan_points,
-            target_network=self.current_heatmap_network,
-            floor=self.current_floor,
-            status_callback=self._heatmap_progress_callback
-        )
+        image, rect, locations = result if result is not None else (None, None, None)
+        if self._heatmap_base is not None and result is not None:
+            # Only the changed region was rendered. Copies share pixels until
+            # painted, so the cached heatmap of the previous revision stays intact.
+            pixmap = QPixmap(self._heatmap_base)
+        else:
+            pixmap = QPixmap(self.heatmap_generator.width, self.heatmap_generator.height)
+            pixmap.fill(Qt.transparent)
+        if image is not None:
+            painter = QPainter(pixmap)
+            painter.setCompositionMode(QPainter.CompositionMode_Source)
+            painter.drawImage(rect[0], rect[1], image)
+            painter.end()
+
+        self.heatmap_pixmap = pixmap
+        self._heatmap_dirty = False
+        self._heatmap_base = None
+        self._heatmap_source = None
+        if locations is not None:
+            self._heatmap_source = (pixmap, (id(self.current_floor), self.current_heatmap_network,
+                                             self.heatmap_generator.width, self.heatmap_generator.height),
+                                    locations)
+        QPixmapCache.insert(cache_key, pixmap)
 
         # Clear progress message - show completion
         network_display = self.current_heatmap_network or "unknown network"
         completion_message = self.i18n.get_string("heatmap_progress_completed").format(network=network_display)
         self._update_status(completion_message)
 
-        if self.debug_mode:
+        if _log.isEnabledFor(logging.DEBUG):
             networks = self.heatmap_generator.get_connected_networks(self.current_floor.scan_points)
-            print(f"DEBUG: Heatmap updated. Connected networks: {networks}")
+            _log.debug("Heatmap updated. Connected networks: %s", networks)
+
+        if self.heatmap_enabled:
+            self._render_map()
+
+    def _wait_for_workers(self):
+        """Block until running scans and heatmap renders are done (on quit)"""
+        self._scan_pool.clear()  # Drop queued scans that have not started
+        self._scan_pool.waitForDone()
+        QThreadPool.globalInstance().waitForDone()
+
+    def _heatmap_cache_key(self):
+        """
+        QPixmapCache key of the current floor's heatmap for the selected network.
+
+        Returns:
+            Key string, or None without a floor
+        """
+        if not self.current_floor:
+            return None
+        return (f"heatmap:{id(self.current_floor)}:{self.current_heatmap_network or '_strongest'}:"
+                f"{self._scan_revision}:{self.heatmap_generator.width}x{self.heatmap_generator.height}")
 
     def set_heatmap_enabled(self, enabled: bool):
         """Enable or disable heatmap display"""
@@ -299,20 +1228,20 @@ class InteractiveMapView(QWidget):
                 self._update_heatmap()
             self._render_map()
 
-            if self.debug_mode:
-                print(f"DEBUG: Heatmap {'enabled' if enabled else 'disabled'}")
+            _log.debug("Heatmap %s", 'enabled' if enabled else 'disabled')
 
     def set_heatmap_network(self, network_ssid: str = None):
         """Set the target network for heatmap display"""
         if self.current_heatmap_network != network_ssid:
             self.current_heatmap_network = network_ssid
+            self._heatmap_dirty = True
             if self.heatmap_enabled:
                 self._update_heatmap()
                 self._render_map()
 
-            if self.debug_mode:
+            if _log.isEnabledFor(logging.DEBUG):
                 network_name = network_ssid if network_ssid else "Strongest Signal"
-                print(f"DEBUG: Heatmap network set to: {network_name}")
+                _log.debug("Heatmap network set to: %s", network_name)
 
     def set_heatmap_network_and_enable(self, network_ssid: str = None, enabled: bool = True):
         """Set both heatmap network and enabled state in a single operation to avoid double generation"""
@@ -322,15 +1251,17 @@ class InteractiveMapView(QWidget):
         # Update both states
         self.current_heatmap_network = network_ssid
         self.heatmap_enabled = enabled
+        if network_changed:
+            self._heatmap_dirty = True
 
         # Only generate heatmap once if either changed and heatmap is now enabled
         if (network_changed or enabled_changed) and self.heatmap_enabled:
             self._update_heatmap()
             self._render_map()
 
-        if self.debug_mode:
+        if _log.isEnabledFor(logging.DEBUG):
             network_name = network_ssid if network_ssid else "Strongest Signal"
-            print(f"DEBUG: Heatmap network set to: {network_name}, enabled: {enabled}")
+            _log.debug("Heatmap network set to: %s, enabled: %s", network_name, enabled)
 
     def set_interference_heatmap_enabled(self, enabled: bool):
         """Enable or disable interference heatmap display"""
@@ -340,8 +1271,7 @@ class InteractiveMapView(QWidget):
                 self._update_interference_heatmap()
             self._render_map()
 
-        if self.debug_mode:
-            print(f"DEBUG: Interference heatmap {'enabled' if enabled else 'disabled'}")
+        _log.debug("Interference heatmap %s", 'enabled' if enabled else 'disabled')
 
     def _draw_interference_heatmap_overlay(self, painter):
         """Draw interference heatmap overlay on the map"""
@@ -364,9 +1294,9 @@ class InteractiveMapView(QWidget):
             return
 
         # Set heatmap dimensions to match floor plan
-        if self.base_pixmap and not self.base_pixmap.isNull():
-            width = self.base_pixmap.width()
-            height = self.base_pixmap.height()
+        if self._plan_size is not None:
+            width = self._plan_size.width()
+            height = self._plan_size.height()
             self.heatmap_generator.width = width
             self.heatmap_generator.height = height
 
@@ -387,8 +1317,7 @@ class InteractiveMapView(QWidget):
         completion_message = "Interference heatmap generation completed"
         self._update_status(completion_message)
 
-        if self.debug_mode:
-            print(f"DEBUG: Interference heatmap updated for {len(self.current_floor.scan_points)} scan points")
+        _log.debug("Interference heatmap updated for %s scan points", len(self.current_floor.scan_points))
 
     def _auto_detect_target_network_prefixes(self) -> List[str]:
         """Auto-detect target network prefixes from scan data"""
@@ -407,14 +1336,13 @@ class InteractiveMapView(QWidget):
         analyzer = InterferenceAnalyzer()
         target_prefixes = analyzer._auto_detect_target_network(all_networks)
 
-        if self.debug_mode:
-            print(f"DEBUG: Auto-detected target network prefixes: {target_prefixes}")
+        _log.debug("Auto-detected target network prefixes: %s", target_prefixes)
 
         return target_prefixes
 
     def _interference_heatmap_progress_callback(self, percent, network_name):
         """Callback for interference heatmap generation progress updates"""
-        if percent == 100:
+        if percent == 100 or not self._progress_due(percent):
             return
 
         progress_message = f"Generating interference heatmap... {percent}%"
@@ -423,8 +1351,7 @@ class InteractiveMapView(QWidget):
     def set_left_click_mode(self, mode: str = None):
         """Set the left-click mode for menu-triggered placement"""
         self.left_click_mode = mode
-        if self.debug_mode:
-            print(f"DEBUG: Left-click mode set to: {mode}")
+        _log.debug("Left-click mode set to: %s", mode)
 
     def wheelEvent(self, event):
         """Handle mouse wheel events for Ctrl+wheel zoom"""
@@ -473,29 +1400,18 @@ class InteractiveMapView(QWidget):
 
     def _apply_zoom(self):
         """Apply current zoom level to the display"""
-        if not self.base_pixmap:
+        if self._base_image is None:
             return
 
-        # Calculate the actual size based on zoom level
-        original_size = self.base_pixmap.size()
-        new_size = original_size * self.zoom_level
-
-        # Resize both the label and the container widget
-        self.map_label.setFixedSize(new_size)
-        self.setFixedSize(new_size)  # Resize the container widget too
-
-        # Scale the display_pixmap to the actual zoom size (no fitting)
-        if self.display_pixmap and not self.display_pixmap.isNull():
-            # Scale to actual zoom size, not to fit label
-            scaled_pixmap = self.display_pixmap.scaled(
-                new_size,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            self.map_label.setPixmap(scaled_pixmap)
-        else:
-            # If no display_pixmap exists, render the map once
-            self._render_map()
+        # Every other change re-renders by itself, so the map on screen is
+        # current if it was rendered at this zoom (e.g. fitting an already
+        # fitted map)
+        if self.zoom_level == self._displayed_zoom:
+            return
+
+        # Re-render at the actual zoom size, not to fit label (resizes the
+        # label and the container widget); the scaled floor plan is cached
+        self._render_map()
 
     def _emit_zoom_changed(self):
         """Emit zoom level change to update status bar"""
@@ -509,16 +1425,15 @@ class InteractiveMapView(QWidget):
                 break
             parent = parent.parent()
 
-        if self.debug_mode:
-            print(f"DEBUG: Zoom level changed to {zoom_percent}%")
+        _log.debug("Zoom level changed to %s%%", zoom_percent)
 
     def fit_to_window(self, window_size):
         """Fit the map to the specified window size"""
-        if not self.base_pixmap:
+        if self._base_image is None:
             return
 
         # Calculate zoom level to fit the image within the window
-        original_size = self.base_pixmap.size()
+        original_size = self._plan_size
 
         # Calculate scale factors for both width and height
         width_scale = window_size.width() / original_size.width()
@@ -533,8 +1448,7 @@ class InteractiveMapView(QWidget):
         self._apply_zoom()
         self._emit_zoom_changed()
 
-        if self.debug_mode:
-            print(f"DEBUG: Fit to window - zoom level set to {int(self.zoom_level * 100)}%")
+        _log.debug("Fit to window - zoom level set to %s%%", int(self.zoom_level * 100))
 
     def _update_status(self, message):
         """Emit status message to main window"""
@@ -552,6 +1466,9 @@ class InteractiveMapView(QWidget):
         if not self.current_floor or not self.current_floor.scan_points:
             return None
 
+        if not self._strongest_ssid_dirty:
+            return self._strongest_ssid_cache
+
         # Find the SSID with the strongest signal strength
         strongest_signal = -999
         strongest_ssid = None
@@ -565,11 +1482,13 @@ class InteractiveMapView(QWidget):
                     strongest_signal = ap.signal_strength
                     strongest_ssid = ap.ssid
 
+        self._strongest_ssid_cache = strongest_ssid
+        self._strongest_ssid_dirty = False
         return strongest_ssid
 
     def _map_mouse_press(self, event):
         """Handle mouse press events on the map"""
-        if not self.base_pixmap:
+        if self._base_image is None:
             return
 
         # Convert label coordinates to image coordinates
@@ -585,8 +1504,7 @@ class InteractiveMapView(QWidget):
             self._show_context_menu(event.globalPos())
             return
         elif event.button() == Qt.LeftButton:
-            if self.debug_mode:
-                print(f"DEBUG: Left mouse click at map coords ({x}, {y})")
+            _log.debug("Left mouse click at map coords (%s, %s)", x, y)
 
             # Check if we're in a special left-click mode from menu
             if self.left_click_mode == 'place_ap':
@@ -601,37 +1519,75 @@ class InteractiveMapView(QWidget):
             if clicked_ap:
                 self.dragging_ap = clicked_ap
                 self.drag_offset = QPoint(x - int(clicked_ap.map_x), y - int(clicked_ap.map_y))
+                # Everything but the dragged AP stays put while dragging
+                self._static_composite = self._compose_map(exclude_ap=clicked_ap, view_rect=self._view_rect)
+                self._drag_frames = []
                 return
 
             # Left-click on empty space does nothing - use right-click for placement
 
     def _map_mouse_move(self, event):
         """Handle mouse move events (for dragging and hover)"""
-        if not self.base_pixmap:
+        if self._base_image is None:
             return
 
         map_pos = self._label_to_map_coords(event.pos())
         if not map_pos:
             return
 
-        # Handle AP dragging
+        # Handle AP dragging: keep only the latest position until the next frame
         if self.dragging_ap:
-            # Update AP position
-            self.dragging_ap.map_x = map_pos.x() - self.drag_offset.x()
-            self.dragging_ap.map_y = map_pos.y() - self.drag_offset.y()
+            self._pending_drag_pos = map_pos
+            if not self._drag_timer.isActive():
+                self._drag_timer.start()
+
+    def _apply_pending_drag_pos(self):
+        """
+        Move the dragged AP to the latest pending drag position.
 
-            # Re-render the map
+        Returns:
+            bool: True if the AP was moved
+        """
+        if not self.dragging_ap or self._pending_drag_pos is None:
+            return False
+
+        map_pos = self._pending_drag_pos
+        self._pending_drag_pos = None
+        self.current_floor.move_placed_ap(self.dragging_ap, map_pos.x() - self.drag_offset.x(),
+                                          map_pos.y() - self.drag_offset.y())
+        return True
+
+    def _flush_drag(self):
+        """Draw one drag frame at the latest pending drag position"""
+        if not self._apply_pending_drag_pos():
+            return
+
+        # Redraw just the dragged AP over the static composite
+        if self._static_composite is not None:
+            self._render_drag_frame()
+        else:
             self._render_map()
 
     def _map_mouse_release(self, event):
         """Handle mouse release events"""
-        if self.dragging_ap:
+        # The final position is drawn by the full render below
+        self._drag_timer.stop()
+        self._apply_pending_drag_pos()
+
+        dragged_ap = self.dragging_ap
+        if dragged_ap:
 
-            if self.debug_mode:
-                print(f"DEBUG: AP '{self.dragging_ap.name}' moved to ({self.dragging_ap.map_x}, {self.dragging_ap.map_y})")
+            _log.debug("AP '%s' moved to (%s, %s)", self.dragging_ap.name, self.dragging_ap.map_x, self.dragging_ap.map_y)
 
         self.dragging_ap = None
         self.drag_offset = QPoint(0, 0)
+        self._static_composite = None
+        self._drag_frames = []
+
+        # Replace the drag frames with one full render
+        if dragged_ap:
+            self._invalidate_hit_test()
+            self._render_map()
 
     def _show_context_menu(self, global_pos):
         """
@@ -671,7 +1627,7 @@ class InteractiveMapView(QWidget):
         elif clicked_scan_point:
             # Menu options for existing scan point
             scan_point_index = self.current_floor.scan_points.index(clicked_scan_point) + 1
-            networks_count = len(clicked_scan_point.ap_list) if clicked_scan_point.ap_list else 0
+            networks_count = clicked_scan_point.network_count
             context_menu.addAction(f"Scan Point {scan_point_index} ({networks_count} networks)", lambda: None).setEnabled(False)  # Info only
             context_menu.addAction(self.i18n.get_string("rescan_at_this_location"), lambda: self._rescan_scan_point(clicked_scan_point))
             context_menu.addAction(self.i18n.get_string("show_scan_data"), lambda: self._show_scan_point_data(clicked_scan_point))
@@ -710,8 +1666,7 @@ class InteractiveMapView(QWidget):
         # Show the context menu
         context_menu.exec_(global_pos)
 
-        if self.debug_mode:
-            print(f"DEBUG: Context menu shown at map coords ({self.right_click_position.x()}, {self.right_click_position.y()})")
+        _log.debug("Context menu shown at map coords (%s, %s)", self.right_click_position.x(), self.right_click_position.y())
 
     def _edit_ap_properties(self, ap):
         """
@@ -727,8 +1682,7 @@ class InteractiveMapView(QWidget):
             # Emit status signal to show that AP properties were updated
             status_message = self.i18n.get_string("ap_properties_updated_status").format(old_name=old_name)
             self.status_message.emit(status_message)
-            if self.debug_mode:
-                print(f"DEBUG: AP properties updated for '{ap.name}'")
+            _log.debug("AP properties updated for '%s'", ap.name)
 
     def _remove_ap(self, ap):
         """
@@ -746,13 +1700,13 @@ class InteractiveMapView(QWidget):
         )
 
         if reply == QMessageBox.Yes:
-            self.current_floor.placed_aps.remove(ap)
+            self.current_floor.remove_placed_ap(ap)
+            self._invalidate_hit_test()
             self._render_map()
             # Status updates now handled by main window
         # self.status_label.setText(self.i18n.get_string("ap_removed_status").format(ap_name=ap.name))
 
-            if self.debug_mode:
-                print(f"DEBUG: AP '{ap.name}' removed from floor")
+            _log.debug("AP '%s' removed from floor", ap.name)
 
     def _label_to_map_coords(self, label_pos):
         """
@@ -764,35 +1718,17 @@ class InteractiveMapView(QWidget):
         Returns:
             QPoint: Position in the map image coordinates, or None if invalid
         """
-        if not self.display_pixmap or not self.map_label.pixmap():
+        if self._map_xform is None:
             return None
-
-        # Get the displayed pixmap size and the label size
-        displayed_pixmap = self.map_label.pixmap()
-        label_size = self.map_label.size()
-        pixmap_size = displayed_pixmap.size()
-
-        # Calculate offset (image is centered in label)
-        x_offset = (label_size.width() - pixmap_size.width()) // 2
-        y_offset = (label_size.height() - pixmap_size.height()) // 2
+        x_offset, y_offset, width, height, shift_x, shift_y, scale_x, scale_y = self._map_xform
 
         # Check if click is within the displayed image
-        if (label_pos.x() < x_offset or label_pos.x() > x_offset + pixmap_size.width() or
-            label_pos.y() < y_offset or label_pos.y() > y_offset + pixmap_size.height()):
+        x, y = label_pos.x(), label_pos.y()
+        if x < x_offset or x > x_offset + width or y < y_offset or y > y_offset + height:
             return None
 
-        # Convert to image coordinates
-        rel_x = label_pos.x() - x_offset
-        rel_y = label_pos.y() - y_offset
-
-        # Scale to original image size
-        scale_x = self.base_pixmap.width() / pixmap_size.width()
-        scale_y = self.base_pixmap.height() / pixmap_size.height()
-
-        map_x = int(rel_x * scale_x)
-        map_y = int(rel_y * scale_y)
-
-        return QPoint(map_x, map_y)
+        # Shift to zoomed map coordinates and scale to original image size
+        return QPoint(int((x + shift_x) * scale_x), int((y + shift_y) * scale_y))
 
     def _get_ap_at_position(self, x, y, radius=15):
         """
@@ -805,16 +1741,11 @@ class InteractiveMapView(QWidget):
         Returns:
             PlacedAP: AP at position, or None
         """
-        if not self.current_floor:
+        if not self.current_floor or not self.current_floor.placed_aps:
             return None
 
-        for ap in self.current_floor.placed_aps:
-            ap_x, ap_y = int(ap.map_x), int(ap.map_y)
-            distance = ((x - ap_x) ** 2 + (y - ap_y) ** 2) ** 0.5
-            if distance <= radius:
-                return ap
-
-        return None
+        index = self._nearest_within(self.current_floor.placed_ap_positions(), x, y, radius)
+        return self.current_floor.placed_aps[index] if index is not None else None
 
     def _get_scan_point_at_position(self, x, y, tolerance=20):
         """
@@ -830,12 +1761,50 @@ class InteractiveMapView(QWidget):
         if not self.current_floor or not self.current_floor.scan_points:
             return None
 
-        for scan_point in self.current_floor.scan_points:
-            distance = ((x - scan_point.map_x) ** 2 + (y - scan_point.map_y) ** 2) ** 0.5
-            if distance <= tolerance:
-                return scan_point
+        # Nearest scan point within tolerance; misses come back as index n
+        distance, index = self._scan_point_tree().query((x, y), distance_upper_bound=tolerance)
+        return self.current_floor.scan_points[index] if distance <= tolerance else None
 
-        return None
+    def _scan_point_tree(self):
+        """
+        Get the k-d tree over the current floor's scan point positions.
+
+        Returns:
+            cKDTree: Tree whose point indices are scan point indices
+        """
+        positions = self.current_floor.scan_point_positions()
+        if self._scan_kdtree is None or self._scan_kdtree.n != len(positions):
+            self._scan_kdtree = cKDTree(positions)
+        return self._scan_kdtree
+
+    def _nearest_within(self, positions, x, y, radius):
+        """
+        Find the position nearest to (x, y), if it is within radius.
+
+        Args:
+            positions (np.ndarray): (N, 2) array of map coordinates
+            x, y (int): Map coordinates
+            radius (float): Search radius in pixels
+
+        Returns:
+            int: Index of the nearest position, or None
+        """
+        # Squared distances avoid the square root
+        d2 = (positions[:, 0] - x) ** 2 + (positions[:, 1] - y) ** 2
+        index = int(d2.argmin())
+        return index if d2[index] <= radius * radius else None
+
+    def _invalidate_hit_test(self):
+        """Drop the cached hit-test tree and the per-AP state derived from positions"""
+        self._scan_kdtree = None
+        self._scanned_cache.clear()
+
+    def _scan_points_changed(self):
+        """Invalidate everything derived from the floor's scan points"""
+        self._invalidate_hit_test()
+        self._heatmap_dirty = True
+        self._scan_revision += 1
+        self._strongest_ssid_dirty = True
 
     def _place_ap_at_position(self, x, y):
         """
@@ -862,7 +1831,8 @@ class InteractiveMapView(QWidget):
         dialog = APPropertiesDialog(new_ap, self.i18n, parent=self, is_new_ap=True)
         if dialog.exec_() == QDialog.Accepted:
             # User accepted - add the AP to current floor
-            self.current_floor.placed_aps.append(new_ap)
+            self.current_floor.add_placed_ap(new_ap)
+            self._invalidate_hit_test()
 
             # Re-render map
             self._render_map()
@@ -870,16 +1840,14 @@ class InteractiveMapView(QWidget):
             # Emit signal
             self.ap_placed.emit(new_ap)
 
-            if self.debug_mode:
-                print(f"DEBUG: Placed AP '{new_ap.name}' at ({x}, {y})")
+            _log.debug("Placed AP '%s' at (%s, %s)", new_ap.name, x, y)
 
             # Immediately offer to scan at the new AP location
             self._offer_immediate_scan(new_ap)
         else:
             # User cancelled - AP is not added
             self._show_temporary_status_message(self.i18n.get_string("ap_placement_cancelled_status"))
-            if self.debug_mode:
-                print(f"DEBUG: AP placement cancelled at ({x}, {y})")
+            _log.debug("AP placement cancelled at (%s, %s)", x, y)
 
     def _show_temporary_status_message(self, message):
         """
@@ -903,22 +1871,45 @@ class InteractiveMapView(QWidget):
         if replace_existing:
             existing_point = self._get_scan_point_at_position(x, y, tolerance=5)
             if existing_point:
-                self.current_floor.scan_points.remove(existing_point)
+                self.current_floor.remove_scan_point(existing_point)
+                self._scan_points_changed()
 
         # Status updates now handled by main window
         # self.status_label.setText(self.i18n.get_string("scanning_at_location_status").format(x=x, y=y))
 
-        try:
-            if self.use_live_scanning:
-                # Perform live WiFi scan
-                print(f"Performing live WiFi scan at ({x}, {y})...")
-                ap_data_list = self.wifi_scanner.scan(timeout=30)
-                scan_type = "Live"
-            else:
-                # No fallback - show error if WiFi scanning not available
-                QMessageBox.warning(self, self.i18n.get_string("wifi_scanner_error_title"), self.i18n.get_string("wifi_scanning_not_available_message"))
-                return
+        if not self.use_live_scanning:
+            # No fallback - show error if WiFi scanning not available
+            QMessageBox.warning(self, self.i18n.get_string("wifi_scanner_error_title"), self.i18n.get_string("wifi_scanning_not_available_message"))
+            return
+
+        # Perform live WiFi scan; _on_wifi_scan_finished adds the scan point
+        _log.info("Performing live WiFi scan at (%s, %s)...", x, y)
+        self._update_status(f"Scanning at ({x}, {y})...")
+        self._start_wifi_scan(x, y)
+
+    def _start_wifi_scan(self, x, y, ap=None):
+        """
+        Start a live WiFi scan in the background.
+
+        Args:
+            x, y: Map coordinates of the scan point
+            ap (PlacedAP, optional): AP the scan is taken at
+        """
+        task = _WifiScanTask(self.wifi_scanner, {'floor': self.current_floor, 'x': x, 'y': y, 'ap': ap})
+        task.signals.finished.connect(self._on_wifi_scan_finished)
+        task.signals.failed.connect(self._on_wifi_scan_failed)
+        self._scan_pool.start(task)
+
+    def _on_wifi_scan_finished(self, request, ap_data_list):
+        """
+        Add the scan point of a completed background scan (runs on the GUI thread).
 
+        Args:
+            request (dict): Scan request, see _WifiScanTask
+            ap_data_list (list): Detected access points
+        """
+        floor, x, y, ap = request['floor'], request['x'], request['y'], request['ap']
+        try:
             # Create scan point
             scan_point = ScanPoint(
                 map_x=x,
@@ -927,43 +1918,76 @@ class InteractiveMapView(QWidget):
                 ap_list=ap_data_list
             )
 
-            # Add to current floor
-            self.current_floor.scan_points.append(scan_point)
+            # Add to the floor the scan was started on, even if another one is shown now
+            floor.add_scan_point(scan_point)
+            if floor is self.current_floor:
+                self._scan_points_changed()
 
-            # Update heatmap if enabled (new scan data available)
-            if self.heatmap_enabled:
-                self._update_heatmap()
+                # Update heatmap if enabled (new scan data available)
+                self._schedule_heatmap_update()
 
-            # Re-render map
-            self._render_map()
+                # Repaint around the new marker: its number label below it and
+                # the markers of APs within the 10 pixel scan tolerance it may
+                # have turned blue, each reaching marker_extent from its position
+                reach = self.marker_extent + 10
+                self._render_region(QRect(int(x) - reach, int(y) - reach, 2 * reach, 2 * reach))
 
-            # Emit signal
-            self.scan_point_added.emit(scan_point)
+            if ap is None:
+                # Emit signal
+                self.scan_point_added.emit(scan_point)
 
-            # Update status
-            # Update status with scan completion
-            self._update_status(f"Live scan completed at ({x}, {y}) - {len(ap_data_list)} access points detected")
+                # Update status with scan completion
+                self._update_status(f"Live scan completed at ({x}, {y}) - {len(ap_data_list)} access points detected")
+                _log.debug("Added live scan point at (%s, %s) with %s APs", x, y, len(ap_data_list))
+            else:
+                # Update status with AP scan completion
+                self._update_status(f"Live scan at AP '{ap.name}' completed - {len(ap_data_list)} access points detected")
+                _log.debug("Added live scan point at AP '%s' (%s, %s) with %s APs", ap.name, x, y, len(ap_data_list))
+        except Exception as e:
+            self._on_wifi_scan_failed(request, e)
 
-            if self.debug_mode:
-                print(f"DEBUG: Added {scan_type.lower()} scan point at ({x}, {y}) with {len(ap_data_list)} APs")
+    def _on_wifi_scan_failed(self, request, error):
+        """
+        Report a failed background scan (runs on the GUI thread).
 
-        except WiFiScanError as e:
+        Args:
+            request (dict): Scan request, see _WifiScanTask
+            error (Exception): What went wrong
+        """
+        ap = request['ap']
+        location = f"({request['x']}, {request['y']})" if ap is None else f"AP '{ap.name}'"
+
+        if isinstance(error, WiFiScanError):
             # Handle scan errors gracefully
-            error_msg = f"WiFi scan failed at ({x}, {y}): {e}"
-            print(f"ERROR: {error_msg}")
-            # Status updates now handled by main window
-        # self.status_label.setText(self.i18n.get_string("scan_failed_status").format(x=x, y=y))
+            _log.error("WiFi scan failed at %s: %s", location, error)
 
             # Show error to user - no fallback
-            QMessageBox.warning(self, self.i18n.get_string("wifi_scan_error_title"),
-                              self.i18n.get_string("live_wifi_scanning_failed_message").format(error=e))
-        except Exception as e:
+            self._show_scan_error(self.i18n.get_string("wifi_scan_error_title"),
+                                  self.i18n.get_string("live_wifi_scanning_failed_message").format(error=error),
+                                  QMessageBox.Warning)
+        else:
             # Handle unexpected errors
-            error_msg = f"Unexpected error during scan at ({x}, {y}): {e}"
-            print(f"ERROR: {error_msg}")
-            # Status updates now handled by main window
-        # self.status_label.setText(self.i18n.get_string("scan_error_status").format(x=x, y=y))
-            QMessageBox.critical(self, self.i18n.get_string("scan_error_title"), error_msg)
+            error_msg = f"Unexpected error during scan at {location}: {error}"
+            _log.error("%s", error_msg)
+            self._show_scan_error(self.i18n.get_string("scan_error_title"), error_msg, QMessageBox.Critical)
+
+    def _show_scan_error(self, title, message, icon):
+        """
+        Show a scan failure in the shared scan error box. Failures of queued
+        scans arriving while it is open update its text instead of stacking
+        further modal dialogs.
+
+        Args:
+            title (str): Window title
+            message (str): Error message
+            icon (QMessageBox.Icon): Warning or Critical
+        """
+        box = self._scan_error_box
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(message)
+        if not box.isVisible():
+            box.exec_()
 
     def set_placement_mode(self, mode):
         """
@@ -978,13 +2002,13 @@ class InteractiveMapView(QWidget):
         # Status updates now handled by main window
         # self.status_label.setText(self.i18n.get_string("status_legend").format(scan_status=scan_status))
 
-        if self.debug_mode:
-            print(f"DEBUG: Placement mode set to: {mode} (but all placement now via right-click)")
+        _log.debug("Placement mode set to: %s (but all placement now via right-click)", mode)
 
     def clear_all_aps(self):
         """Remove all placed APs from the current floor"""
         if self.current_floor:
-            self.current_floor.placed_aps.clear()
+            self.current_floor.clear_placed_aps()
+            self._invalidate_hit_test()
             self._render_map()
             # Status updates now handled by main window
         # self.status_label.setText(self.i18n.get_string("all_aps_cleared_status"))
@@ -992,11 +2016,11 @@ class InteractiveMapView(QWidget):
     def clear_all_scan_points(self):
         """Remove all scan points from the current floor"""
         if self.current_floor:
-            self.current_floor.scan_points.clear()
-            # Update heatmap if enabled (scan data cleared)
-            if self.heatmap_enabled:
-                self._update_heatmap()
-            self._render_map()
+            self.current_floor.clear_scan_points()
+            self._scan_points_changed()
+            # No scan data left to draw a heatmap from
+            self._clear_heatmap()
+            self._schedule_render()
             # Status updates now handled by main window
         # self.status_label.setText(self.i18n.get_string("all_scan_points_cleared_status"))
 
@@ -1010,7 +2034,8 @@ class InteractiveMapView(QWidget):
 
         # Clear all scan points
         if self.current_floor.scan_points:
-            self.current_floor.scan_points.clear()
+            self.current_floor.clear_scan_points()
+            self._scan_points_changed()
 
         # Clear scan data from all APs
         if self.current_floor.placed_aps:
@@ -1019,13 +2044,13 @@ class InteractiveMapView(QWidget):
                     ap.associated_scan_data.clear()
                     ap.timestamp_last_scan = None
                     cleared_ap_data += 1
+        self._scanned_cache.clear()
 
-        # Update heatmap if enabled (all scan data cleared)
-        if self.heatmap_enabled:
-            self._update_heatmap()
+        # No scan data left to draw a heatmap from
+        self._clear_heatmap()
 
         # Re-render map
-        self._render_map()
+        self._schedule_render()
 
         # Update status
         parts = []
@@ -1043,8 +2068,7 @@ class InteractiveMapView(QWidget):
             # self.status_label.setText(self.i18n.get_string("no_scan_data_to_clear_status"))
             pass
 
-        if self.debug_mode:
-            print(f"DEBUG: Cleared {cleared_scan_points} scan points and scan data from {cleared_ap_data} APs")
+        _log.debug("Cleared %s scan points and scan data from %s APs", cleared_scan_points, cleared_ap_data)
 
     def _scan_at_ap(self, ap):
         """
@@ -1053,61 +2077,17 @@ class InteractiveMapView(QWidget):
         Args:
             ap (PlacedAP): The AP to scan at
         """
+        if not self.use_live_scanning:
+            # No fallback - show error if WiFi scanning not available
+            QMessageBox.warning(self, self.i18n.get_string("wifi_scanner_error_title"), self.i18n.get_string("wifi_scanning_not_available_message"))
+            return
+
         # Update status for AP scanning
         self._update_status(f"Scanning at AP '{ap.name}'...")
 
-        try:
-            if self.use_live_scanning:
-                # Perform live WiFi scan
-                print(f"Performing live WiFi scan at AP '{ap.name}' ({ap.map_x}, {ap.map_y})...")
-                ap_data_list = self.wifi_scanner.scan(timeout=30)
-                scan_type = "Live"
-            else:
-                # No fallback - show error if WiFi scanning not available
-                QMessageBox.warning(self, self.i18n.get_string("wifi_scanner_error_title"), self.i18n.get_string("wifi_scanning_not_available_message"))
-                return
-
-            # Create scan point at AP location
-            scan_point = ScanPoint(
-                map_x=ap.map_x,
-                map_y=ap.map_y,
-                timestamp=datetime.datetime.now(),
-                ap_list=ap_data_list
-            )
-
-            self.current_floor.scan_points.append(scan_point)
-
-            # Update heatmap if enabled (new scan data available)
-            if self.heatmap_enabled:
-                self._update_heatmap()
-
-            # Re-render map
-            self._render_map()
-
-            # Update status
-            # Update status with AP scan completion
-            self._update_status(f"Live scan at AP '{ap.name}' completed - {len(ap_data_list)} access points detected")
-
-            if self.debug_mode:
-                print(f"DEBUG: Added {scan_type.lower()} scan point at AP '{ap.name}' ({ap.map_x}, {ap.map_y}) with {len(ap_data_list)} APs")
-
-        except WiFiScanError as e:
-            # Handle scan errors gracefully
-            error_msg = f"WiFi scan failed at AP '{ap.name}': {e}"
-            print(f"ERROR: {error_msg}")
-            # Status updates now handled by main window
-        # self.status_label.setText(self.i18n.get_string("ap_scan_failed_status").format(ap_name=ap.name))
-
-            # Show error to user - no fallback
-            QMessageBox.warning(self, self.i18n.get_string("wifi_scan_error_title"),
-                              self.i18n.get_string("live_wifi_scanning_failed_message").format(error=e))
-        except Exception as e:
-            # Handle unexpected errors
-            error_msg = f"Unexpected error during scan at AP '{ap.name}': {e}"
-            print(f"ERROR: {error_msg}")
-            # Status updates now handled by main window
-        # self.status_label.setText(self.i18n.get_string("ap_scan_error_status").format(ap_name=ap.name))
-            QMessageBox.critical(self, self.i18n.get_string("scan_error_title"), error_msg)
+        # Perform live WiFi scan; _on_wifi_scan_finished adds the scan point
+        _log.info("Performing live WiFi scan at AP '%s' (%s, %s)...", ap.name, ap.map_x, ap.map_y)
+        self._start_wifi_scan(ap.map_x, ap.map_y, ap)
 
     def _clear_ap_scan_data(self, ap):
         """
@@ -1118,13 +2098,13 @@ class InteractiveMapView(QWidget):
         """
         ap.associated_scan_data.clear()
         ap.timestamp_last_scan = None
+        self._scanned_cache.pop(id(ap), None)
 
         # Update status
         # Status updates now handled by main window
         # self.status_label.setText(self.i18n.get_string("ap_scan_data_cleared_status").format(ap_name=ap.name))
 
-        if self.debug_mode:
-            print(f"DEBUG: Cleared scan data from AP '{ap.name}' while keeping placement")
+        _log.debug("Cleared scan data from AP '%s' while keeping placement", ap.name)
 
     def _remove_scan_point(self, scan_point):
         """
@@ -1133,24 +2113,25 @@ class InteractiveMapView(QWidget):
         Args:
             scan_point (ScanPoint): The scan point to remove
         """
-        if scan_point in self.current_floor.scan_points:
-            scan_point_index = self.current_floor.scan_points.index(scan_point) + 1
-            networks_count = len(scan_point.ap_list) if scan_point.ap_list else 0
+        # Find and remove it in one pass over the list
+        try:
+            scan_point_index = self.current_floor.remove_scan_point(scan_point) + 1
+        except ValueError:
+            return
+        networks_count = scan_point.network_count
 
-            self.current_floor.scan_points.remove(scan_point)
+        self._scan_points_changed()
 
-            # Update heatmap if enabled (scan data removed)
-            if self.heatmap_enabled:
-                self._update_heatmap()
+        # Update heatmap if enabled (scan data removed)
+        self._schedule_heatmap_update()
 
-            # Re-render map
-            self._render_map()
+        # Re-render map
+        self._schedule_render()
 
-            # Status updates now handled by main window
+        # Status updates now handled by main window
         # self.status_label.setText(f"Scan Point {scan_point_index} removed ({networks_count} networks)")
 
-            if self.debug_mode:
-                print(f"DEBUG: Removed scan point at ({scan_point.map_x}, {scan_point.map_y}) with {networks_count} networks")
+        _log.debug("Removed scan point at (%s, %s) with %s networks", scan_point.map_x, scan_point.map_y, networks_count)
 
     def _remove_all_aps(self):
         """
@@ -1164,16 +2145,17 @@ class InteractiveMapView(QWidget):
 
         # Clear everything
         if self.current_floor.placed_aps:
-            self.current_floor.placed_aps.clear()
+            self.current_floor.clear_placed_aps()
+            self._invalidate_hit_test()
         if self.current_floor.scan_points:
-            self.current_floor.scan_points.clear()
+            self.current_floor.clear_scan_points()
+            self._scan_points_changed()
 
-        # Update heatmap if enabled (all data cleared)
-        if self.heatmap_enabled:
-            self._update_heatmap()
+        # No scan data left to draw a heatmap from
+        self._clear_heatmap()
 
         # Re-render map
-        self._render_map()
+        self._schedule_render()
 
         # Update status
         parts = []
@@ -1191,8 +2173,7 @@ class InteractiveMapView(QWidget):
             # self.status_label.setText(self.i18n.get_string("no_aps_to_remove_status"))
             pass
 
-        if self.debug_mode:
-            print(f"DEBUG: Removed {ap_count} APs and {scan_point_count} scan points - full cleanup")
+        _log.debug("Removed %s APs and %s scan points - full cleanup", ap_count, scan_point_count)
 
     def _offer_immediate_scan(self, ap):
         """
@@ -1228,20 +2209,59 @@ class InteractiveMapView(QWidget):
         Returns:
             bool: True if AP has scan data, False otherwise
         """
-        # Check if AP has associated scan data
-        if ap.associated_scan_data and len(ap.associated_scan_data) > 0:
-            return True
+        has_scan_data = self._scanned_cache.get(id(ap))
+        if has_scan_data is None:
+            # Check if AP has associated scan data, or if there are any scan points
+            # at or very near the AP location (within 10 pixels)
+            has_scan_data = bool(ap.associated_scan_data) or \
+                self._get_scan_point_at_position(ap.map_x, ap.map_y, tolerance=10) is not None
+            self._scanned_cache[id(ap)] = has_scan_data
+        return has_scan_data
+
+    def _update_scanned_cache(self, aps):
+        """
+        Compute _has_scan_data for the given APs not cached yet, with a
+        single vectorized query for all their positions.
 
-        # Check if there are any scan points at or very near the AP location (within 10 pixels)
-        for scan_point in self.current_floor.scan_points:
-            distance = ((ap.map_x - scan_point.map_x) ** 2 + (ap.map_y - scan_point.map_y) ** 2) ** 0.5
-            if distance <= 10:  # Very close to AP location
-                return True
+        Args:
+            aps (list): PlacedAP objects about to be drawn
+        """
+        missing = [ap for ap in aps if id(ap) not in self._scanned_cache]
+        if not missing:
+            return
+
+        # Same 10 pixel tolerance as _has_scan_data
+        if self.current_floor.scan_points:
+            positions = np.array([(ap.map_x, ap.map_y) for ap in missing], dtype=np.float64)
+            distances, _ = self._scan_point_tree().query(positions, distance_upper_bound=10)
+            near_scan_point = distances <= 10
+        else:
+            near_scan_point = np.zeros(len(missing), dtype=bool)
+
+        for ap, near in zip(missing, near_scan_point):
+            self._scanned_cache[id(ap)] = bool(ap.associated_scan_data) or bool(near)
 
-        return False
+    def _progress_due(self, percent):
+        """
+        Throttle heatmap progress messages to one per progress_interval.
+
+        Args:
+            percent (int): Progress reported; 100% is always shown
+
+        Returns:
+            bool: True if the message should be shown
+        """
+        now = time.monotonic()
+        if percent < 100 and now - self._last_progress_time < self.progress_interval:
+            return False
+        self._last_progress_time = now
+        return True
 
     def _heatmap_progress_callback(self, percent, network_name):
         """Callback for heatmap generation progress updates"""
+        if not self._progress_due(percent):
+            return
+
         # Format progress message using i18n
         network_display = network_name or "unknown network"
         progress_message = self.i18n.get_string("heatmap_progress_generating").format(
@@ -1249,7 +2269,6 @@ class InteractiveMapView(QWidget):
             percent=percent
         )
         self._update_status(progress_message)
-        QApplication.processEvents()  # Force UI update to show progress immediately
 
     def _rescan_scan_point(self, scan_point):
         """Rescan at an existing scan point location"""
@@ -1276,47 +2295,27 @@ class InteractiveMapView(QWidget):
         header_label.setStyleSheet("font-weight: bold; padding: 10px;")
         layout.addWidget(header_label)
 
-        # Scrollable area
-        scroll_area = QScrollArea()
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout(scroll_widget)
-
-        # Find scan points near this AP
+        # Find scan points near this AP, in scan order
         nearby_scan_points = []
         tolerance = 50  # pixels
 
-        for scan_point in self.current_floor.scan_points:
-            distance = ((scan_point.map_x - ap.map_x) ** 2 + (scan_point.map_y - ap.map_y) ** 2) ** 0.5
-            if distance <= tolerance:
-                nearby_scan_points.append(scan_point)
+        if self.current_floor.scan_points:
+            nearby = self._scan_point_tree().query_ball_point((ap.map_x, ap.map_y), r=tolerance)
+            nearby_scan_points = [self.current_floor.scan_points[i] for i in sorted(nearby)]
 
         if nearby_scan_points:
             # Show ALL measurements from ALL nearby scan points
+            parts = []
             for i, scan_point in enumerate(nearby_scan_points):
-                # Scan point header
-                sp_label = QLabel(f"Scan Point {i+1} - Location: ({int(scan_point.map_x)}, {int(scan_point.map_y)})")
-                sp_label.setStyleSheet("background-color: #f0f0f0; padding: 5px; margin-top: 5px; font-weight: bold;")
-                scroll_layout.addWidget(sp_label)
-
-                # All networks from this scan point
-                sorted_networks = sorted(scan_point.ap_list, key=lambda x: x.signal_strength, reverse=True)
-                for network in sorted_networks:
-                    ssid = network.ssid if network.ssid else "{Hidden}"
-                    network_info = f"• {ssid}\n  BSSID: {network.bssid}\n  RSSI: {network.signal_strength} dBm\n  Band: {network.band}"
-
-                    net_label = QLabel(network_info)
-                    net_label.setStyleSheet("padding: 5px; margin-left: 10px; border-left: 2px solid #ccc;")
-                    net_label.setWordWrap(True)
-                    scroll_layout.addWidget(net_label)
+                # Scan point header, then all networks from this scan point
+                parts.append(f'<p class="scan-point">Scan Point {i+1} - Location: '
+                             f'({int(scan_point.map_x)}, {int(scan_point.map_y)})</p>')
+                parts.append(self._networks_html(scan_point.sorted_ap_list))
+            body = "".join(parts)
         else:
-            no_data_label = QLabel("No scan data available near this AP")
-            no_data_label.setStyleSheet("padding: 20px; font-style: italic; color: #666;")
-            scroll_layout.addWidget(no_data_label)
+            body = '<p class="empty">No scan data available near this AP</p>'
 
-        scroll_layout.addStretch()
-        scroll_area.setWidget(scroll_widget)
-        scroll_area.setWidgetResizable(True)
-        layout.addWidget(scroll_area)
+        layout.addWidget(self._scan_data_view(body))
 
         # Close button
         close_button = QPushButton("Close")
@@ -1341,36 +2340,17 @@ class InteractiveMapView(QWidget):
         scan_point_index = self.current_floor.scan_points.index(scan_point) + 1
 
         # Header info
-        header_label = QLabel(f"Scan Point {scan_point_index}\nLocation: ({int(scan_point.map_x)}, {int(scan_point.map_y)})\nNetworks detected: {len(scan_point.ap_list) if scan_point.ap_list else 0}")
+        header_label = QLabel(f"Scan Point {scan_point_index}\nLocation: ({int(scan_point.map_x)}, {int(scan_point.map_y)})\nNetworks detected: {scan_point.network_count}")
         header_label.setStyleSheet("font-weight: bold; padding: 10px;")
         layout.addWidget(header_label)
 
-        # Scrollable area
-        scroll_area = QScrollArea()
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout(scroll_widget)
-
         if scan_point.ap_list:
-            # Sort networks by signal strength (strongest first)
-            sorted_networks = sorted(scan_point.ap_list, key=lambda x: x.signal_strength, reverse=True)
-
-            for network in sorted_networks:
-                ssid = network.ssid if network.ssid else "{Hidden}"
-                network_info = f"• {ssid}\n  BSSID: {network.bssid}\n  RSSI: {network.signal_strength} dBm\n  Band: {network.band}"
-
-                net_label = QLabel(network_info)
-                net_label.setStyleSheet("padding: 8px; margin: 2px; border: 1px solid #ddd; border-radius: 4px; background-color: #fafafa;")
-                net_label.setWordWrap(True)
-                scroll_layout.addWidget(net_label)
+            # Networks by signal strength (strongest first)
+            body = self._networks_html(scan_point.sorted_ap_list)
         else:
-            no_data_label = QLabel("No networks detected at this scan point")
-            no_data_label.setStyleSheet("padding: 20px; font-style: italic; color: #666;")
-            scroll_layout.addWidget(no_data_label)
+            body = '<p class="empty">No networks detected at this scan point</p>'
 
-        scroll_layout.addStretch()
-        scroll_area.setWidget(scroll_widget)
-        scroll_area.setWidgetResizable(True)
-        layout.addWidget(scroll_area)
+        layout.addWidget(self._scan_data_view(body))
 
         # Close button
         close_button = QPushButton("Close")
@@ -1379,6 +2359,40 @@ class InteractiveMapView(QWidget):
 
         dialog.exec_()
 
+    def _networks_html(self, networks):
+        """
+        HTML list of networks for the scan data dialogs.
+
+        Args:
+            networks (list): APData objects, in display order
+
+        Returns:
+            str: One block per network
+        """
+        row = _NETWORK_ROW_HTML.format
+        escape = html.escape
+        return "".join([
+            row(ssid=escape(network.ssid or _HIDDEN_SSID), bssid=escape(str(network.bssid)),
+                rssi=network.signal_strength, band=escape(str(network.band)))
+            for network in networks])
+
+    def _scan_data_view(self, body):
+        """
+        Read-only, natively scrolling view of a scan data dialog's network list.
+        One document replaces a label per network, so large scans open quickly.
+
+        Args:
+            body (str): HTML using the classes of _SCAN_DATA_CSS
+
+        Returns:
+            QTextEdit: The view
+        """
+        view = QTextEdit()
+        view.setReadOnly(True)
+        view.document().setDefaultStyleSheet(_SCAN_DATA_CSS)
+        view.setHtml(body)
+        return view
+
 
 class APPropertiesDialog(QDialog):
     """Dialog for editing Access Point properties"""
@@ -16,10 +16,15 @@ import sys
 import platform
 import subprocess
 import json
+import logging
 import time
 from typing import List, Optional
 from .data_models import APData
 
+# Scans run on a worker thread; progress goes to logging (silent at the
+# default WARNING level) instead of unconditional prints
+_log = logging.getLogger(__name__)
+
 
 class WiFiScanner:
     """
@@ -65,7 +70,7 @@ class WiFiScanner:
             WiFiScanError: If scanning fails or times out
         """
         try:
-            print(f"Starting WiFi scan on {self.platform}...")
+            _log.debug("Starting WiFi scan on %s...", self.platform)
             
             # Execute the appropriate script
             if self.platform == "Windows":
@@ -79,7 +84,7 @@ class WiFiScanner:
             # Convert to APData objects
             ap_list = self._parse_scan_data(scan_data)
             
-            print(f"Scan completed. Found {len(ap_list)} access points.")
+            _log.debug("Scan completed. Found %s access points.", len(ap_list))
             return ap_list
             
         except json.JSONDecodeError as e:
@@ -103,7 +108,7 @@ class WiFiScanner:
             "-File", self.script_path
         ]
         
-        print(f"Executing: {' '.join(cmd)}")
+        _log.debug("Executing: %s", ' '.join(cmd))
         
         return subprocess.run(
             cmd,
@@ -122,11 +127,11 @@ class WiFiScanner:
         try:
             os.chmod(self.script_path, 0o755)
         except OSError as e:
-            print(f"Warning: Could not make script executable: {e}")
+            _log.warning("Could not make script executable: %s", e)
         
         cmd = ["/bin/bash", self.script_path]
         
-        print(f"Executing: {' '.join(cmd)}")
+        _log.debug("Executing: %s", ' '.join(cmd))
         
         return subprocess.run(
             cmd,
@@ -183,7 +188,7 @@ class WiFiScanner:
                 ap_list.append(ap_data)
                 
             except Exception as e:
-                print(f"Warning: Failed to parse AP entry {entry}: {e}")
+                _log.warning("Failed to parse AP entry %s: %s", entry, e)
                 continue
         
         return ap_list
@@ -14,8 +14,10 @@
 
 import sys
 import os
+import logging
 import platform
 from PyQt5.QtWidgets import QApplication, QMessageBox
+from PyQt5.QtGui import QPixmapCache
 
 # Ensure the 'app' directory is in the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
@@ -32,10 +34,18 @@ def main():
     """
     app = QApplication(sys.argv)
 
+    # Room for several full-size heatmap overlays (~8 MB each at 1920x1080);
+    # Qt's 10 MB default holds only one
+    QPixmapCache.setCacheLimit(65536)
+
     # --- Determine Debug Mode from Environment Variable ---
     # Set WLAN_SCANNER_DEBUG=1 (or True/true) in your environment to enable debug logging.
     debug_mode = os.environ.get("WLAN_SCANNER_DEBUG", "0").lower() in ("1", "true")
+    # Modules log through the standard logging module; in debug mode the
+    # application's loggers are lowered to DEBUG (third-party ones stay quiet)
+    logging.basicConfig(format="%(levelname)s: %(message)s")
     if debug_mode:
+        logging.getLogger("app").setLevel(logging.DEBUG)
         print("DEBUG: WLAN_SCANNER_DEBUG environment variable detected. Debug mode is ON.")
     # ----------------------------------------------------
 
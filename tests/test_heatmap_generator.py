@@ -0,0 +1,72 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+from app.data_models import APData, ScanPoint
+from app.heatmap_generator import HeatmapGenerator
+
+
+def _baseline_signal_to_color(generator, signal_strength):
+    """The original linear scan over SIGNAL_RANGES"""
+    for min_signal, max_signal, color in generator.SIGNAL_RANGES:
+        if max_signal <= signal_strength <= min_signal:
+            return color
+    return generator.SIGNAL_RANGES[-1][2]
+
+
+class SignalToColorTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+        cls.generator = HeatmapGenerator()
+
+    def test_fractional_values_at_band_edges(self):
+        edges = [-20, -45, -60, -75, -90, -120]
+        for edge in edges:
+            for offset in (-0.9, -0.5, -0.1, 0.0, 0.1, 0.5, 0.9):
+                signal = edge + offset
+                with self.subTest(signal=signal):
+                    self.assertEqual(self.generator._signal_to_color(signal),
+                                     _baseline_signal_to_color(self.generator, signal))
+
+    def test_whole_dbm_values(self):
+        for signal in range(0, -130, -1):
+            with self.subTest(signal=signal):
+                self.assertEqual(self.generator._signal_to_color(signal),
+                                 _baseline_signal_to_color(self.generator, signal))
+
+    def test_nan_maps_to_blue(self):
+        self.assertEqual(self.generator._signal_to_color(float("nan")),
+                         self.generator.SIGNAL_RANGES[-1][2])
+
+
+class MissingIdentifiersTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def _scan_points(self):
+        def ap(ssid, bssid, signal):
+            return APData(ssid, bssid, 6, signal, "WPA2", 2437, 70, "2.4 GHz")
+
+        return [
+            ScanPoint(10, 10, 0, [ap("Corp", "aa:aa", -40), ap(None, "bb:bb", -60), ap("Guest", None, -70)]),
+            ScanPoint(50, 10, 1, [ap("Corp", "aa:aa", -50), ap(None, "bb:bb", -65), ap("Guest", None, -75)]),
+            ScanPoint(90, 10, 2, [ap("Corp", "aa:aa", -60), ap(None, "bb:bb", -55)]),
+        ]
+
+    def test_connected_networks_with_none_ssid(self):
+        networks = HeatmapGenerator().get_connected_networks(self._scan_points())
+        self.assertEqual(networks[0], "Corp")
+        self.assertIn("", networks)
+
+    def test_ap_locations_with_none_ssid_and_bssid(self):
+        locations = HeatmapGenerator()._identify_ap_locations(self._scan_points())
+        self.assertEqual(sorted(locations.bssids, key=str), sorted(["aa:aa", "bb:bb", None], key=str))
+
+
+if __name__ == "__main__":
+    unittest.main()